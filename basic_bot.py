@@ -4,22 +4,164 @@ BasicBot - A reusable Python class for Binance USDT-M Futures Testnet
 """
 
 import os
-import json
+import hmac
+import time
+import uuid
+import queue
+import atexit
+import asyncio
+import hashlib
 import logging
 import argparse
+import threading
+import concurrent.futures
+from functools import lru_cache, wraps
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlencode
+import orjson
+import requests
+import websockets
+from requests.adapters import HTTPAdapter
 from binance.client import Client
-from binance.exceptions import BinanceAPIException, BinanceOrderException
+from binance.exceptions import BinanceAPIException, BinanceOrderException, BinanceRequestException
 from dotenv import load_dotenv
 
 
+# Binance USDT-M Futures WebSocket API (trading over a persistent connection)
+WS_API_URL = "wss://testnet.binancefuture.com/ws-fapi/v1"
+WS_REQUEST_TIMEOUT = 10
+
+# Seconds between pings that keep the pooled REST connection warm
+KEEPALIVE_INTERVAL = 30
+
+# Fixed order parameters per order type, merged into the per-symbol order templates
+ORDER_TYPE_PARAMS = {
+    'MARKET': {'type': 'MARKET'},
+    'LIMIT': {'type': 'LIMIT', 'timeInForce': 'GTC'},
+    'STOP_MARKET': {'type': 'STOP_MARKET'},
+    'OCO': {'stopLimitTimeInForce': 'GTC'}
+}
+
+# Most orders /fapi/v1/batchOrders accepts in one request
+BATCH_ORDERS_LIMIT = 5
+
+# Errors an API call is expected to fail with; anything else is a bug and propagates
+API_ERRORS = (
+    BinanceAPIException,
+    BinanceOrderException,
+    BinanceRequestException,
+    ValueError,
+    requests.RequestException,
+    websockets.exceptions.WebSocketException,
+    ConnectionError,
+    TimeoutError,
+    asyncio.TimeoutError
+)
+
+
+_DOTENV_LOADED = False
+
+# Shared by every BasicBot in the process; writes log records to file/console
+_LOG_LISTENER = None
+
+
+def _ensure_dotenv():
+    """Load the .env file once per process rather than on every bot construction"""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        load_dotenv()
+        _DOTENV_LOADED = True
+
+
+def _dumps(obj: Any, pretty: bool = False) -> str:
+    """Serialize to a JSON string with orjson (2-space indented when pretty)"""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+
+
+class FastFormatter(logging.Formatter):
+    """
+    Log formatter that renders asctime at second resolution and reuses the
+    rendered string for every record within the same second
+    """
+    
+    def __init__(self, fmt: str = None):
+        super().__init__(fmt)
+        self._cached_second = None
+        self._cached_time = ""
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        """Format the record time, skipping strftime when the second has not changed"""
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+        return self._cached_time
+
+
+def _api_call(context: str):
+    """
+    Decorator for public API methods: log expected errors (API_ERRORS) and
+    return them as an ERROR result dict
+    
+    Args:
+        context (str): Name reported in the error log
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return fn(self, *args, **kwargs)
+            except API_ERRORS as e:
+                self._log_error(e, context)
+                return {
+                    'status': 'ERROR',
+                    'error': str(e),
+                    'timestamp_ns': time.time_ns()
+                }
+        return wrapper
+    return decorator
+
+
+@lru_cache(maxsize=256)
+def _validate_symbol_cached(symbol: str) -> str:
+    """Validate and format a raw symbol string (cached, the result only depends on the input)"""
+    if not symbol:
+        raise ValueError("Symbol cannot be empty")
+    
+    # Convert to uppercase and remove spaces
+    symbol = symbol.upper().strip()
+    
+    # Basic validation for USDT pairs
+    if not symbol.endswith('USDT'):
+        raise ValueError("Symbol must end with USDT for USDT-M Futures")
+    
+    return symbol
+
+
+@lru_cache(maxsize=256)
+def _validate_side_cached(side: str) -> str:
+    """Validate and format a raw order side string (cached, the result only depends on the input)"""
+    side = side.upper().strip()
+    if side not in ['BUY', 'SELL']:
+        raise ValueError("Side must be either 'BUY' or 'SELL'")
+    
+    return side
+
+
 class BasicBot:
     """
     A reusable bot class for Binance USDT-M Futures Testnet trading
     """
     
-    def __init__(self, api_key: str = None, api_secret: str = None, demo: bool = False):
+    __slots__ = (
+        'demo', 'api_key', 'api_secret', 'client', 'logger',
+        '_ws', '_ws_loop', '_ws_reader', '_ws_pending',
+        '_hmac_template', '_keepalive_stop', '_order_template_cache'
+    )
+    
+    def __init__(self, api_key: str = None, api_secret: str = None, demo: bool = False, use_ws: bool = False):
         """
         Initialize the BasicBot with API credentials
         
@@ -27,11 +169,19 @@ class BasicBot:
             api_key (str): Binance API key
             api_secret (str): Binance API secret
             demo (bool): If True, run in demo mode (no real API calls)
+            use_ws (bool): If True, submit orders over the WebSocket API instead of REST
         """
         # Load environment variables
-        load_dotenv()
+        _ensure_dotenv()
         
         self.demo = demo
+        self._ws = None
+        self._ws_loop = None
+        self._ws_reader = None
+        self._ws_pending = {}
+        self._keepalive_stop = threading.Event()
+        self._order_template_cache = {}
+        self._hmac_template = None
         # Setup logging
         self._setup_logging()
         if self.demo:
@@ -45,6 +195,8 @@ class BasicBot:
             self.api_secret = api_secret or os.getenv('BINANCE_API_SECRET')
             if not self.api_key or not self.api_secret:
                 raise ValueError("API credentials are required. Set BINANCE_API_KEY and BINANCE_API_SECRET environment variables or pass them as parameters.")
+            # Keyed HMAC state, copied for each signature instead of re-keying
+            self._hmac_template = hmac.new(self.api_secret.encode(), digestmod=hashlib.sha256)
             # Initialize Binance client for testnet
             self.client = Client(
                 api_key=self.api_key,
@@ -52,22 +204,194 @@ class BasicBot:
                 testnet=True,  # Enable testnet mode
                 base_url="https://testnet.binancefuture.com"  # Testnet endpoint
             )
+            self._configure_session()
+            self._warm_up()
+            self._start_keepalive()
             self.logger.info("BasicBot initialized successfully in testnet mode")
+            if use_ws:
+                try:
+                    self._start_ws()
+                except BaseException:
+                    # Stop the keep-alive and event loop threads started so far
+                    self.close()
+                    raise
+    
+    def _configure_session(self):
+        """
+        Keep REST connections to the testnet endpoint alive and pooled
+        
+        The TCP connection and TLS session are reused across orders, so only
+        the first request pays for the handshakes.
+        """
+        session = self.client.session
+        session.headers["Connection"] = "keep-alive"
+        session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=0))
+    
+    def _warm_up(self):
+        """Open the pooled connection now so the first order does not pay DNS, TCP and TLS setup"""
+        try:
+            self.client.futures_ping()
+            self.client.futures_time()
+        except Exception as e:
+            self.logger.warning("Connection warm-up failed: %s", e)
+    
+    def _start_keepalive(self):
+        """Ping the futures API periodically so the pooled connection is not dropped while idle"""
+        def keepalive():
+            while not self._keepalive_stop.wait(KEEPALIVE_INTERVAL):
+                try:
+                    self.client.futures_ping()
+                except Exception as e:
+                    self.logger.warning("Keep-alive ping failed: %s", e)
+        
+        threading.Thread(target=keepalive, name='BasicBotKeepAlive', daemon=True).start()
+    
+    def _start_ws(self):
+        """Run the WebSocket event loop in a background thread and connect"""
+        self._ws_loop = asyncio.new_event_loop()
+        threading.Thread(target=self._ws_loop.run_forever, name='BasicBotWS', daemon=True).start()
+        asyncio.run_coroutine_threadsafe(self.start(), self._ws_loop).result(timeout=WS_REQUEST_TIMEOUT)
+        self.logger.info("WebSocket API connected - %s", WS_API_URL)
+    
+    async def start(self):
+        """Open the WebSocket API connection and start the response reader"""
+        self._ws = await websockets.connect(WS_API_URL)
+        self._ws_reader = asyncio.create_task(self._ws_read_loop())
+    
+    async def _ws_read_loop(self):
+        """
+        Resolve pending requests as their responses arrive
+        
+        When the connection ends, cleanly or not, the bot drops it so later
+        orders go over REST.
+        """
+        try:
+            async for frame in self._ws:
+                message = orjson.loads(frame)
+                future = self._ws_pending.get(message.get('id'))
+                if future is not None and not future.done():
+                    future.set_result(message)
+        except websockets.exceptions.ConnectionClosed as e:
+            self.logger.warning("WebSocket API connection lost, falling back to REST: %s", e)
+        finally:
+            self._ws = None
+            for future in self._ws_pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("WebSocket API connection closed"))
+    
+    async def _ws_send(self, request_id: str, method: str, params: Dict) -> Dict:
+        """Send a request frame and wait for the response with the same id"""
+        if self._ws is None:
+            raise ConnectionError("WebSocket API connection closed")
+        future = asyncio.get_running_loop().create_future()
+        self._ws_pending[request_id] = future
+        try:
+            await self._ws.send(_dumps({'id': request_id, 'method': method, 'params': params}))
+            return await future
+        finally:
+            self._ws_pending.pop(request_id, None)
+    
+    def _sign(self, query: bytes) -> str:
+        """
+        Sign a query string with the API secret
+        
+        Args:
+            query (bytes): urlencoded request parameters
+            
+        Returns:
+            str: Hex HMAC-SHA256 signature
+        """
+        signature = self._hmac_template.copy()
+        signature.update(query)
+        return signature.hexdigest()
+    
+    def _ws_request(self, method: str, params: Dict) -> Dict:
+        """
+        Send a signed request over the WebSocket API
+        
+        Args:
+            method (str): WebSocket API method (e.g., order.place)
+            params (Dict): Request parameters
+            
+        Returns:
+            Dict: The result payload of the response
+        """
+        signed = {key: str(value) for key, value in params.items()}
+        signed['apiKey'] = self.api_key
+        signed['timestamp'] = str(int(time.time() * 1000))
+        query = urlencode(sorted(signed.items()))
+        signed['signature'] = self._sign(query.encode())
+        
+        request_id = str(uuid.uuid4())
+        future = asyncio.run_coroutine_threadsafe(self._ws_send(request_id, method, signed), self._ws_loop)
+        try:
+            message = future.result(timeout=WS_REQUEST_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            # Cancelling the task runs _ws_send's finally, which drops the pending entry
+            future.cancel()
+            raise TimeoutError(f"No WebSocket API response to {method} within {WS_REQUEST_TIMEOUT}s") from None
+        
+        if message.get('status') != 200:
+            raise BinanceAPIException(None, message.get('status'), _dumps(message.get('error', {})))
+        return message['result']
+    
+    async def _ws_close(self):
+        """Close the WebSocket connection and wait for the reader to finish"""
+        if self._ws is not None:
+            await self._ws.close()
+        if self._ws_reader is not None:
+            try:
+                await self._ws_reader
+            except websockets.exceptions.ConnectionClosed:
+                pass
+    
+    def close(self):
+        """Release network resources held by the bot"""
+        self._keepalive_stop.set()
+        if self._ws_loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._ws_close(), self._ws_loop).result(timeout=WS_REQUEST_TIMEOUT)
+        finally:
+            self._ws_loop.call_soon_threadsafe(self._ws_loop.stop)
+            self._ws = None
+            self._ws_loop = None
+            self._ws_reader = None
+    
+    def _submit_order(self, params: Dict) -> Dict:
+        """Submit an order over the WebSocket API when connected, otherwise over REST"""
+        if self._ws is not None:
+            return self._ws_request('order.place', params)
+        return self.client.futures_create_order(**params)
     
     def _setup_logging(self):
-        """Setup logging configuration"""
+        """
+        Setup logging configuration
+        
+        Logging calls only put records on a queue; a background QueueListener
+        thread does the file and console writes, so no disk I/O happens on
+        the thread placing orders.
+        """
+        global _LOG_LISTENER
         # Create logs directory if it doesn't exist
         os.makedirs('logs', exist_ok=True)
         
-        # Configure logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('logs/bot.log'),
-                logging.StreamHandler()
-            ]
-        )
+        # Configure logging once per process
+        if _LOG_LISTENER is None:
+            log_queue = queue.SimpleQueue()
+            formatter = FastFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            handlers = [logging.FileHandler('logs/bot.log'), logging.StreamHandler()]
+            for handler in handlers:
+                handler.setFormatter(formatter)
+            
+            _LOG_LISTENER = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            _LOG_LISTENER.start()
+            # Flush queued records before the interpreter exits
+            atexit.register(_LOG_LISTENER.stop)
+            
+            root_logger = logging.getLogger()
+            root_logger.setLevel(logging.INFO)
+            root_logger.addHandler(QueueHandler(log_queue))
         
         self.logger = logging.getLogger('BasicBot')
     
@@ -81,17 +405,7 @@ class BasicBot:
         Returns:
             str: Formatted symbol
         """
-        if not symbol:
-            raise ValueError("Symbol cannot be empty")
-        
-        # Convert to uppercase and remove spaces
-        symbol = symbol.upper().strip()
-        
-        # Basic validation for USDT pairs
-        if not symbol.endswith('USDT'):
-            raise ValueError("Symbol must end with USDT for USDT-M Futures")
-        
-        return symbol
+        return _validate_symbol_cached(symbol)
     
     def _validate_quantity(self, quantity: float) -> float:
         """
@@ -133,28 +447,47 @@ class BasicBot:
         Returns:
             str: Validated side
         """
-        side = side.upper().strip()
-        if side not in ['BUY', 'SELL']:
-            raise ValueError("Side must be either 'BUY' or 'SELL'")
+        return _validate_side_cached(side)
+    
+    def _order_templates(self, symbol: str, side: str, order_type: str):
+        """
+        Get the cached order parameters and response skeleton for a symbol/side/type
         
-        return side
+        Args:
+            symbol (str): Validated trading symbol
+            side (str): Validated order side
+            order_type (str): Order type (MARKET/LIMIT/STOP_MARKET/OCO)
+            
+        Returns:
+            tuple: (params template, formatted response template); callers copy
+            them and add the per-order fields rather than mutating them
+        """
+        key = (symbol, side, order_type)
+        templates = self._order_template_cache.get(key)
+        if templates is None:
+            params = {'symbol': symbol, 'side': side, **ORDER_TYPE_PARAMS[order_type]}
+            skeleton = {'status': 'SUCCESS', 'order_type': order_type, 'symbol': symbol, 'side': side}
+            templates = self._order_template_cache[key] = (params, skeleton)
+        return templates
     
     def _log_api_request(self, method: str, endpoint: str, params: Dict = None):
         """Log API request details"""
-        self.logger.info(f"API Request - Method: {method}, Endpoint: {endpoint}")
-        if params:
-            self.logger.info(f"API Request Parameters: {json.dumps(params, indent=2)}")
+        self.logger.info("API Request - Method: %s, Endpoint: %s", method, endpoint)
+        if params and self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("API Request Parameters: %s", _dumps(params))
     
     def _log_api_response(self, response: Dict):
-        """Log API response details"""
-        self.logger.info(f"API Response: {json.dumps(response, indent=2)}")
+        """Log API response details (serialized only when INFO is enabled)"""
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("API Response: %s", _dumps(response))
     
     def _log_error(self, error: Exception, context: str = ""):
         """Log error details"""
-        self.logger.error(f"Error in {context}: {str(error)}")
+        self.logger.error("Error in %s: %s", context, error)
         if hasattr(error, 'response'):
-            self.logger.error(f"Error Response: {error.response.text if error.response else 'No response'}")
+            self.logger.error("Error Response: %s", error.response.text if error.response else 'No response')
     
+    @_api_call("place_market_order")
     def place_market_order(self, symbol: str, side: str, quantity: float) -> Dict[str, Any]:
         """
         Place a market order
@@ -167,64 +500,42 @@ class BasicBot:
         Returns:
             Dict[str, Any]: Order response
         """
-        try:
-            # Validate inputs
-            symbol = self._validate_symbol(symbol)
-            side = self._validate_side(side)
-            quantity = self._validate_quantity(quantity)
-            
-            self.logger.info(f"Placing market order - Symbol: {symbol}, Side: {side}, Quantity: {quantity}")
-            
-            if self.demo:
-                # Simulate a market order response
-                response = {
-                    'orderId': 123456,
-                    'clientOrderId': 'demo123',
-                    'avgPrice': '50000.00',
-                    'status': 'FILLED'
-                }
-            else:
-                # Prepare order parameters
-                params = {
-                    'symbol': symbol,
-                    'side': side,
-                    'type': 'MARKET',
-                    'quantity': quantity
-                }
-                self._log_api_request('POST', '/fapi/v1/order', params)
-                response = self.client.futures_create_order(**params)
-                self._log_api_response(response)
-            formatted_response = {
-                'status': 'SUCCESS',
-                'order_type': 'MARKET',
-                'symbol': symbol,
-                'side': side,
-                'quantity': quantity,
-                'order_id': response.get('orderId'),
-                'client_order_id': response.get('clientOrderId'),
-                'price': response.get('avgPrice', 'N/A'),
-                'status': response.get('status'),
-                'timestamp': datetime.now().isoformat(),
-                'raw_response': response
-            }
-            self.logger.info(f"Market order placed successfully - Order ID: {formatted_response.get('order_id')}")
-            return formatted_response
-            
-        except (BinanceAPIException, BinanceOrderException) as e:
-            self._log_error(e, "place_market_order")
-            return {
-                'status': 'ERROR',
-                'error': str(e),
-                'timestamp': datetime.now().isoformat()
-            }
-        except Exception as e:
-            self._log_error(e, "place_market_order")
-            return {
-                'status': 'ERROR',
-                'error': str(e),
-                'timestamp': datetime.now().isoformat()
+        # Validate inputs
+        symbol = self._validate_symbol(symbol)
+        side = self._validate_side(side)
+        quantity = self._validate_quantity(quantity)
+        
+        self.logger.info("Placing market order - Symbol: %s, Side: %s, Quantity: %s", symbol, side, quantity)
+        params_template, response_template = self._order_templates(symbol, side, 'MARKET')
+        
+        if self.demo:
+            # Simulate a market order response
+            response = {
+                'orderId': 123456,
+                'clientOrderId': 'demo123',
+                'avgPrice': '50000.00',
+                'status': 'FILLED'
             }
+        else:
+            # Prepare order parameters
+            params = {**params_template, 'quantity': quantity}
+            self._log_api_request('POST', '/fapi/v1/order', params)
+            response = self._submit_order(params)
+            self._log_api_response(response)
+        formatted_response = {
+            **response_template,
+            'quantity': quantity,
+            'order_id': response.get('orderId'),
+            'client_order_id': response.get('clientOrderId'),
+            'price': response.get('avgPrice', 'N/A'),
+            'order_status': response.get('status'),
+            'timestamp_ns': time.time_ns(),
+            'raw_response': response
+        }
+        self.logger.info("Market order placed successfully - Order ID: %s", formatted_response['order_id'])
+        return formatted_response
     
+    @_api_call("place_limit_order")
     def place_limit_order(self, symbol: str, side: str, quantity: float, price: float) -> Dict[str, Any]:
         """
         Place a limit order
@@ -238,64 +549,40 @@ class BasicBot:
         Returns:
             Dict[str, Any]: Order response
         """
-        try:
-            # Validate inputs
-            symbol = self._validate_symbol(symbol)
-            side = self._validate_side(side)
-            quantity = self._validate_quantity(quantity)
-            price = self._validate_price(price)
-            
-            self.logger.info(f"Placing limit order - Symbol: {symbol}, Side: {side}, Quantity: {quantity}, Price: {price}")
-            
-            if self.demo:
-                response = {
-                    'orderId': 234567,
-                    'clientOrderId': 'demoLimit',
-                    'status': 'NEW'
-                }
-            else:
-                params = {
-                    'symbol': symbol,
-                    'side': side,
-                    'type': 'LIMIT',
-                    'timeInForce': 'GTC',
-                    'quantity': quantity,
-                    'price': price
-                }
-                self._log_api_request('POST', '/fapi/v1/order', params)
-                response = self.client.futures_create_order(**params)
-                self._log_api_response(response)
-            formatted_response = {
-                'status': 'SUCCESS',
-                'order_type': 'LIMIT',
-                'symbol': symbol,
-                'side': side,
-                'quantity': quantity,
-                'price': price,
-                'order_id': response.get('orderId'),
-                'client_order_id': response.get('clientOrderId'),
-                'status': response.get('status'),
-                'timestamp': datetime.now().isoformat(),
-                'raw_response': response
-            }
-            self.logger.info(f"Limit order placed successfully - Order ID: {formatted_response.get('order_id')}")
-            return formatted_response
-            
-        except (BinanceAPIException, BinanceOrderException) as e:
-            self._log_error(e, "place_limit_order")
-            return {
-                'status': 'ERROR',
-                'error': str(e),
-                'timestamp': datetime.now().isoformat()
-            }
-        except Exception as e:
-            self._log_error(e, "place_limit_order")
-            return {
-                'status': 'ERROR',
-                'error': str(e),
-                'timestamp': datetime.now().isoformat()
+        # Validate inputs
+        symbol = self._validate_symbol(symbol)
+        side = self._validate_side(side)
+        quantity = self._validate_quantity(quantity)
+        price = self._validate_price(price)
+        
+        self.logger.info("Placing limit order - Symbol: %s, Side: %s, Quantity: %s, Price: %s", symbol, side, quantity, price)
+        params_template, response_template = self._order_templates(symbol, side, 'LIMIT')
+        
+        if self.demo:
+            response = {
+                'orderId': 234567,
+                'clientOrderId': 'demoLimit',
+                'status': 'NEW'
             }
+        else:
+            params = {**params_template, 'quantity': quantity, 'price': price}
+            self._log_api_request('POST', '/fapi/v1/order', params)
+            response = self._submit_order(params)
+            self._log_api_response(response)
+        formatted_response = {
+            **response_template,
+            'quantity': quantity,
+            'price': price,
+            'order_id': response.get('orderId'),
+            'client_order_id': response.get('clientOrderId'),
+            'order_status': response.get('status'),
+            'timestamp_ns': time.time_ns(),
+            'raw_response': response
+        }
+        self.logger.info("Limit order placed successfully - Order ID: %s", formatted_response['order_id'])
+        return formatted_response
     
+    @_api_call("place_stop_market_order")
     def place_stop_market_order(self, symbol: str, side: str, quantity: float, stop_price: float) -> Dict[str, Any]:
         """
         Place a stop market order
@@ -309,71 +596,48 @@ class BasicBot:
         Returns:
             Dict[str, Any]: Order response
         """
-        try:
-            # Validate inputs
-            symbol = self._validate_symbol(symbol)
-            side = self._validate_side(side)
-            quantity = self._validate_quantity(quantity)
-            stop_price = self._validate_price(stop_price)
-            
-            self.logger.info(f"Placing stop market order - Symbol: {symbol}, Side: {side}, Quantity: {quantity}, Stop Price: {stop_price}")
-            
-            if self.demo:
-                response = {
-                    'orderId': 345678,
-                    'clientOrderId': 'demoStop',
-                    'status': 'NEW'
-                }
-            else:
-                # Prepare order parameters
-                params = {
-                    'symbol': symbol,
-                    'side': side,
-                    'type': 'STOP_MARKET',
-                    'quantity': quantity,
-                    'stopPrice': stop_price
-                }
-                
-                self._log_api_request('POST', '/fapi/v1/order', params)
-                
-                # Place order
-                response = self.client.futures_create_order(**params)
-                
-                self._log_api_response(response)
-            
-            # Format response for output
-            formatted_response = {
-                'status': 'SUCCESS',
-                'order_type': 'STOP_MARKET',
-                'symbol': symbol,
-                'side': side,
-                'quantity': quantity,
-                'stop_price': stop_price,
-                'order_id': response.get('orderId'),
-                'client_order_id': response.get('clientOrderId'),
-                'status': response.get('status'),
-                'timestamp': datetime.now().isoformat(),
-                'raw_response': response
+        # Validate inputs
+        symbol = self._validate_symbol(symbol)
+        side = self._validate_side(side)
+        quantity = self._validate_quantity(quantity)
+        stop_price = self._validate_price(stop_price)
+        
+        self.logger.info("Placing stop market order - Symbol: %s, Side: %s, Quantity: %s, Stop Price: %s", symbol, side, quantity, stop_price)
+        params_template, response_template = self._order_templates(symbol, side, 'STOP_MARKET')
+        
+        if self.demo:
+            response = {
+                'orderId': 345678,
+                'clientOrderId': 'demoStop',
+                'status': 'NEW'
             }
+        else:
+            # Prepare order parameters
+            params = {**params_template, 'quantity': quantity, 'stopPrice': stop_price}
             
-            self.logger.info(f"Stop market order placed successfully - Order ID: {formatted_response.get('order_id')}")
-            return formatted_response
+            self._log_api_request('POST', '/fapi/v1/order', params)
             
-        except (BinanceAPIException, BinanceOrderException) as e:
-            self._log_error(e, "place_stop_market_order")
-            return {
-                'status': 'ERROR',
-                'error': str(e),
-                'timestamp': datetime.now().isoformat()
-            }
-        except Exception as e:
-            self._log_error(e, "place_stop_market_order")
-            return {
-                'status': 'ERROR',
-                'error': str(e),
-                'timestamp': datetime.now().isoformat()
-            }
+            # Place order
+            response = self._submit_order(params)
+            
+            self._log_api_response(response)
+        
+        # Format response for output
+        formatted_response = {
+            **response_template,
+            'quantity': quantity,
+            'stop_price': stop_price,
+            'order_id': response.get('orderId'),
+            'client_order_id': response.get('clientOrderId'),
+            'order_status': response.get('status'),
+            'timestamp_ns': time.time_ns(),
+            'raw_response': response
+        }
+        
+        self.logger.info("Stop market order placed successfully - Order ID: %s", formatted_response['order_id'])
+        return formatted_response
     
+    @_api_call("get_account_info")
     def get_account_info(self) -> Dict[str, Any]:
         """
         Get account information
@@ -381,37 +645,30 @@ class BasicBot:
         Returns:
             Dict[str, Any]: Account information
         """
-        try:
-            self.logger.info("Fetching account information")
-            if self.demo:
-                response = {
-                    'totalWalletBalance': '10000.00',
-                    'totalUnrealizedProfit': '0.00',
-                    'assets': [
-                        {'asset': 'USDT', 'walletBalance': '10000.00', 'unrealizedProfit': '0.00'}
-                    ]
-                }
-                return {
-                    'status': 'SUCCESS',
-                    'account_info': response,
-                    'timestamp': datetime.now().isoformat()
-                }
-            else:
-                response = self.client.futures_account()
-                self._log_api_response(response)
-                return {
-                    'status': 'SUCCESS',
-                    'account_info': response,
-                    'timestamp': datetime.now().isoformat()
-                }
-        except Exception as e:
-            self._log_error(e, "get_account_info")
+        self.logger.info("Fetching account information")
+        if self.demo:
+            response = {
+                'totalWalletBalance': '10000.00',
+                'totalUnrealizedProfit': '0.00',
+                'assets': [
+                    {'asset': 'USDT', 'walletBalance': '10000.00', 'unrealizedProfit': '0.00'}
+                ]
+            }
             return {
-                'status': 'ERROR',
-                'error': str(e),
-                'timestamp': datetime.now().isoformat()
+                'status': 'SUCCESS',
+                'account_info': response,
+                'timestamp_ns': time.time_ns()
+            }
+        else:
+            response = self.client.futures_account()
+            self._log_api_response(response)
+            return {
+                'status': 'SUCCESS',
+                'account_info': response,
+                'timestamp_ns': time.time_ns()
             }
     
+    @_api_call("place_oco_order")
     def place_oco_order(self, symbol: str, side: str, quantity: float, limit_price: float, stop_price: float, stop_limit_price: float) -> Dict[str, Any]:
         """
         Place an OCO (One-Cancels-the-Other) order
@@ -427,80 +684,64 @@ class BasicBot:
         Returns:
             Dict[str, Any]: Order response
         """
-        try:
-            # Validate inputs
-            symbol = self._validate_symbol(symbol)
-            side = self._validate_side(side)
-            quantity = self._validate_quantity(quantity)
-            limit_price = self._validate_price(limit_price)
-            stop_price = self._validate_price(stop_price)
-            stop_limit_price = self._validate_price(stop_limit_price)
-            
-            self.logger.info(f"Placing OCO order - Symbol: {symbol}, Side: {side}, Quantity: {quantity}, Limit Price: {limit_price}, Stop Price: {stop_price}, Stop Limit Price: {stop_limit_price}")
-            
-            if self.demo:
-                response = {
-                    'orderListId': 456789,
-                    'contingencyType': 'OCO',
-                    'listStatusType': 'RESPONSE',
-                    'listOrderStatus': 'EXEC_STARTED',
-                    'listClientOrderId': 'demoOCO'
-                }
-            else:
-                # Prepare OCO order parameters
-                params = {
-                    'symbol': symbol,
-                    'side': side,
-                    'quantity': quantity,
-                    'price': limit_price,
-                    'stopPrice': stop_price,
-                    'stopLimitPrice': stop_limit_price,
-                    'stopLimitTimeInForce': 'GTC'
-                }
-                
-                self._log_api_request('POST', '/fapi/v1/order/oco', params)
-                
-                # Place OCO order
-                response = self.client.futures_create_oco_order(**params)
-                
-                self._log_api_response(response)
-            
-            # Format response for output
-            formatted_response = {
-                'status': 'SUCCESS',
-                'order_type': 'OCO',
-                'symbol': symbol,
-                'side': side,
+        # Validate inputs
+        symbol = self._validate_symbol(symbol)
+        side = self._validate_side(side)
+        quantity = self._validate_quantity(quantity)
+        limit_price = self._validate_price(limit_price)
+        stop_price = self._validate_price(stop_price)
+        stop_limit_price = self._validate_price(stop_limit_price)
+        
+        self.logger.info(
+            "Placing OCO order - Symbol: %s, Side: %s, Quantity: %s, Limit Price: %s, Stop Price: %s, Stop Limit Price: %s",
+            symbol, side, quantity, limit_price, stop_price, stop_limit_price
+        )
+        params_template, response_template = self._order_templates(symbol, side, 'OCO')
+        
+        if self.demo:
+            response = {
+                'orderListId': 456789,
+                'contingencyType': 'OCO',
+                'listStatusType': 'RESPONSE',
+                'listOrderStatus': 'EXEC_STARTED',
+                'listClientOrderId': 'demoOCO'
+            }
+        else:
+            # Prepare OCO order parameters
+            params = {
+                **params_template,
                 'quantity': quantity,
-                'limit_price': limit_price,
-                'stop_price': stop_price,
-                'stop_limit_price': stop_limit_price,
-                'order_list_id': response.get('orderListId'),
-                'contingency_type': response.get('contingencyType'),
-                'list_status_type': response.get('listStatusType'),
-                'list_order_status': response.get('listOrderStatus'),
-                'timestamp': datetime.now().isoformat(),
-                'raw_response': response
+                'price': limit_price,
+                'stopPrice': stop_price,
+                'stopLimitPrice': stop_limit_price
             }
             
-            self.logger.info(f"OCO order placed successfully - Order List ID: {formatted_response.get('order_list_id')}")
-            return formatted_response
+            self._log_api_request('POST', '/fapi/v1/order/oco', params)
             
-        except (BinanceAPIException, BinanceOrderException) as e:
-            self._log_error(e, "place_oco_order")
-            return {
-                'status': 'ERROR',
-                'error': str(e),
-                'timestamp': datetime.now().isoformat()
-            }
-        except Exception as e:
-            self._log_error(e, "place_oco_order")
-            return {
-                'status': 'ERROR',
-                'error': str(e),
-                'timestamp': datetime.now().isoformat()
-            }
-
+            # Place OCO order
+            response = self.client.futures_create_oco_order(**params)
+            
+            self._log_api_response(response)
+        
+        # Format response for output
+        formatted_response = {
+            **response_template,
+            'quantity': quantity,
+            'limit_price': limit_price,
+            'stop_price': stop_price,
+            'stop_limit_price': stop_limit_price,
+            'order_list_id': response.get('orderListId'),
+            'contingency_type': response.get('contingencyType'),
+            'list_status_type': response.get('listStatusType'),
+            'list_order_status': response.get('listOrderStatus'),
+            'timestamp_ns': time.time_ns(),
+            'raw_response': response
+        }
+        
+        self.logger.info("OCO order placed successfully - Order List ID: %s", formatted_response['order_list_id'])
+        return formatted_response
+    
+    @_api_call("get_order_status")
     def get_order_status(self, symbol: str, order_id: int) -> Dict[str, Any]:
         """
         Get order status
@@ -512,37 +753,184 @@ class BasicBot:
         Returns:
             Dict[str, Any]: Order status
         """
-        try:
-            symbol = self._validate_symbol(symbol)
+        symbol = self._validate_symbol(symbol)
+        
+        self.logger.info("Fetching order status - Symbol: %s, Order ID: %s", symbol, order_id)
+        
+        if self.demo:
+            response = {
+                'orderId': order_id,
+                'symbol': symbol,
+                'status': 'FILLED',
+                'price': '50000.00',
+                'avgPrice': '50000.00',
+                'executedQty': '0.001'
+            }
+        else:
+            response = self.client.futures_get_order(symbol=symbol, orderId=order_id)
+            self._log_api_response(response)
+        
+        return {
+            'status': 'SUCCESS',
+            'order_status': response,
+            'timestamp_ns': time.time_ns()
+        }
+    
+    def _batch_order_params(self, order: Dict[str, Any]):
+        """
+        Validate one batch order and build its API parameters
+        
+        Args:
+            order (Dict[str, Any]): Order in the format accepted by _dispatch_order
             
-            self.logger.info(f"Fetching order status - Symbol: {symbol}, Order ID: {order_id}")
+        Returns:
+            tuple: (API parameters, formatted response template)
+        """
+        order_type = order.get('order_type')
+        if order_type not in ('MARKET', 'LIMIT', 'STOP_MARKET'):
+            raise ValueError(f"Unsupported order type for batch orders: {order_type}")
+        missing = _missing_fields(_ORDER_DISPATCH[order_type][0], order)
+        if missing:
+            raise ValueError(f"Missing fields for {order_type} order: {', '.join(missing)}")
+        
+        symbol = self._validate_symbol(order['symbol'])
+        side = self._validate_side(order['side'])
+        params_template, response_template = self._order_templates(symbol, side, order_type)
+        params = {**params_template, 'quantity': self._validate_quantity(order['quantity'])}
+        if order_type == 'LIMIT':
+            params['price'] = self._validate_price(order['price'])
+        elif order_type == 'STOP_MARKET':
+            params['stopPrice'] = self._validate_price(order['stop_price'])
+        return params, response_template
+    
+    @_api_call("place_batch_orders")
+    def place_batch_orders(self, orders: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Place up to 5 MARKET/LIMIT/STOP_MARKET orders in a single request
+        
+        Args:
+            orders (List[Dict[str, Any]]): Orders in the format accepted by _dispatch_order
             
-            if self.demo:
-                response = {
-                    'orderId': order_id,
-                    'symbol': symbol,
-                    'status': 'FILLED',
-                    'price': '50000.00',
-                    'avgPrice': '50000.00',
-                    'executedQty': '0.001'
-                }
+        Returns:
+            Dict[str, Any]: Batch response with one order response per order under 'orders'
+        """
+        if not orders or len(orders) > BATCH_ORDERS_LIMIT:
+            raise ValueError(f"Batch orders must contain between 1 and {BATCH_ORDERS_LIMIT} orders")
+        
+        prepared = [self._batch_order_params(order) for order in orders]
+        self.logger.info("Placing batch of %d orders", len(prepared))
+        
+        if self.demo:
+            response = [
+                {'orderId': 567890 + i, 'clientOrderId': f'demoBatch{i}', 'status': 'NEW'}
+                for i in range(len(prepared))
+            ]
+        else:
+            # The batch endpoint expects every order field as a string
+            batch = [{key: str(value) for key, value in params.items()} for params, _ in prepared]
+            self._log_api_request('POST', '/fapi/v1/batchOrders', {'batchOrders': batch})
+            response = self.client.futures_place_batch_order(batchOrders=batch)
+            self._log_api_response(response)
+        
+        results = []
+        for (params, response_template), item in zip(prepared, response):
+            if 'code' in item:
+                # Orders in a batch are accepted or rejected individually
+                results.append({
+                    'status': 'ERROR',
+                    'error': f"APIError(code={item.get('code')}): {item.get('msg')}",
+                    'raw_response': item
+                })
             else:
-                response = self.client.futures_get_order(symbol=symbol, orderId=order_id)
-                self._log_api_response(response)
+                results.append({
+                    **response_template,
+                    'quantity': params['quantity'],
+                    'order_id': item.get('orderId'),
+                    'client_order_id': item.get('clientOrderId'),
+                    'order_status': item.get('status'),
+                    'raw_response': item
+                })
+        
+        self.logger.info("Batch placed - %d of %d orders accepted", sum(r['status'] == 'SUCCESS' for r in results), len(results))
+        return {
+            'status': 'SUCCESS',
+            'orders': results,
+            'timestamp_ns': time.time_ns()
+        }
+    
+    def _dispatch_order(self, order: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Place a single order described by a dict
+        
+        Args:
+            order (Dict[str, Any]): Order fields, keyed like the CLI arguments
+                (order_type, symbol, side, quantity, price, stop_price,
+                limit_price, stop_limit_price)
             
-            return {
-                'status': 'SUCCESS',
-                'order_status': response,
-                'timestamp': datetime.now().isoformat()
-            }
+        Returns:
+            Dict[str, Any]: Order response
+        """
+        order_type = order.get('order_type')
+        if order_type not in _ORDER_DISPATCH:
+            raise ValueError(f"Unsupported order type: {order_type}")
+        
+        required, place = _ORDER_DISPATCH[order_type]
+        missing = _missing_fields(required, order)
+        if missing:
+            raise ValueError(f"Missing fields for {order_type} order: {', '.join(missing)}")
+        return place(self, order)
+    
+    async def place_orders(self, orders: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Place several independent orders concurrently
+        
+        All orders are in flight at the same time, so N orders take roughly
+        one round-trip instead of N.
+        
+        Args:
+            orders (List[Dict[str, Any]]): Orders in the format accepted by _dispatch_order
             
-        except Exception as e:
-            self._log_error(e, "get_order_status")
-            return {
-                'status': 'ERROR',
-                'error': str(e),
-                'timestamp': datetime.now().isoformat()
-            }
+        Returns:
+            List[Any]: One order response (or raised exception) per order, in order
+        """
+        self.logger.info("Placing %d orders concurrently", len(orders))
+        coros = [asyncio.to_thread(self._dispatch_order, order) for order in orders]
+        return await asyncio.gather(*coros, return_exceptions=True)
+
+
+# Order type -> (required order fields, placement call). Orders are mappings
+# keyed like the CLI arguments, so the CLI and place_orders share this table.
+_ORDER_DISPATCH = {
+    'MARKET': (
+        ('symbol', 'side', 'quantity'),
+        lambda bot, o: bot.place_market_order(o['symbol'], o['side'], o['quantity'])
+    ),
+    'LIMIT': (
+        ('symbol', 'side', 'quantity', 'price'),
+        lambda bot, o: bot.place_limit_order(o['symbol'], o['side'], o['quantity'], o['price'])
+    ),
+    'STOP_MARKET': (
+        ('symbol', 'side', 'quantity', 'stop_price'),
+        lambda bot, o: bot.place_stop_market_order(o['symbol'], o['side'], o['quantity'], o['stop_price'])
+    ),
+    'OCO': (
+        ('symbol', 'side', 'quantity', 'limit_price', 'stop_price', 'stop_limit_price'),
+        lambda bot, o: bot.place_oco_order(o['symbol'], o['side'], o['quantity'], o['limit_price'], o['stop_price'], o['stop_limit_price'])
+    )
+}
+
+
+def _missing_fields(required, order: Dict[str, Any]) -> List[str]:
+    """Names of required order fields that are not set in order"""
+    return [name for name in required if order.get(name) is None]
+
+
+def _format_result(result: Dict[str, Any]) -> str:
+    """Render a result for the CLI, converting timestamp_ns to an ISO timestamp"""
+    timestamp_ns = result.get('timestamp_ns')
+    if timestamp_ns is not None:
+        result = {**result, 'timestamp': datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()}
+    return _dumps(result, pretty=True)
 
 
 def main():
@@ -551,9 +939,10 @@ def main():
     parser.add_argument('--api-key', help='Binance API Key')
     parser.add_argument('--api-secret', help='Binance API Secret')
     parser.add_argument('--demo', action='store_true', help='Run in demo mode (no real API calls)')
+    parser.add_argument('--ws', action='store_true', help='Submit orders over the WebSocket API')
     parser.add_argument('--symbol', help='Trading symbol (e.g., BTCUSDT)')
     parser.add_argument('--side', choices=['BUY', 'SELL'], help='Order side')
-    parser.add_argument('--order-type', choices=['MARKET', 'LIMIT', 'STOP_MARKET', 'OCO'], help='Order type')
+    parser.add_argument('--order-type', choices=list(_ORDER_DISPATCH), help='Order type')
     parser.add_argument('--quantity', type=float, help='Order quantity')
     parser.add_argument('--price', type=float, help='Order price (for LIMIT orders)')
     parser.add_argument('--stop-price', type=float, help='Stop price (for STOP_MARKET orders)')
@@ -565,43 +954,34 @@ def main():
     
     try:
         # Initialize bot
-        bot = BasicBot(api_key=args.api_key, api_secret=args.api_secret, demo=args.demo)
-        
-        # Handle account info request
-        if args.account_info:
-            result = bot.get_account_info()
-            print(json.dumps(result, indent=2))
-            return
-        
-        # Validate required arguments for order placement
-        if not all([args.symbol, args.side, args.order_type, args.quantity]):
-            print("Error: symbol, side, order-type, and quantity are required for order placement")
-            return
+        bot = BasicBot(api_key=args.api_key, api_secret=args.api_secret, demo=args.demo, use_ws=args.ws)
         
-        # Place order based on type
-        if args.order_type == 'MARKET':
-            result = bot.place_market_order(args.symbol, args.side, args.quantity)
-        elif args.order_type == 'LIMIT':
-            if not args.price:
-                print("Error: price is required for LIMIT orders")
+        try:
+            # Handle account info request
+            if args.account_info:
+                result = bot.get_account_info()
+                print(_format_result(result))
                 return
-            result = bot.place_limit_order(args.symbol, args.side, args.quantity, args.price)
-        elif args.order_type == 'STOP_MARKET':
-            if not args.stop_price:
-                print("Error: stop-price is required for STOP_MARKET orders")
+            
+            # Validate required arguments for order placement
+            if not all([args.symbol, args.side, args.order_type, args.quantity]):
+                print("Error: symbol, side, order-type, and quantity are required for order placement")
                 return
-            result = bot.place_stop_market_order(args.symbol, args.side, args.quantity, args.stop_price)
-        elif args.order_type == 'OCO':
-            if not all([args.limit_price, args.stop_price, args.stop_limit_price]):
-                print("Error: limit-price, stop-price, and stop-limit-price are required for OCO orders")
+            
+            # Place order based on type
+            required, place = _ORDER_DISPATCH[args.order_type]
+            options = vars(args)
+            missing = _missing_fields(required, options)
+            if missing:
+                print(f"Error: {', '.join(name.replace('_', '-') for name in missing)} required for {args.order_type} orders")
                 return
-            result = bot.place_oco_order(args.symbol, args.side, args.quantity, args.limit_price, args.stop_price, args.stop_limit_price)
-        else:
-            print(f"Error: Unsupported order type: {args.order_type}")
-            return
-        
-        # Print result
-        print(json.dumps(result, indent=2))
+            result = place(bot, options)
+            
+            # Print result
+            print(_format_result(result))
+        finally:
+            # Stop the keep-alive ping and close any WebSocket connection cleanly
+            bot.close()
         
     except Exception as e:
         print(f"Error: {str(e)}")
@@ -5,12 +5,81 @@ GUI for BasicBot - A modern interface for Binance USDT-M Futures Testnet trading
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+import os
+import re
+import sys
 import json
+import time
+import queue
 import threading
-from datetime import datetime
+from collections import deque
 from basic_bot import BasicBot
 
 
+# Most lines kept in the log area; older lines are dropped
+LOG_MAX_LINES = 1000
+
+# Delay before queued log lines are written to the log area (~60 Hz).
+# When flushes keep running more than LOG_FLUSH_SATURATED_MS late on
+# average, the main loop is saturated and the delay backs off to ~30 Hz.
+LOG_FLUSH_MS = 16
+LOG_FLUSH_SLOW_MS = 33
+LOG_FLUSH_SATURATED_MS = 32
+# Weight of the newest sample in the flush-lateness moving average
+LOG_FLUSH_EMA_ALPHA = 0.2
+
+# Compact JSON for full API payloads in the log; pretty-printing large
+# account payloads costs far more than it helps readability
+JSON_SEPARATORS = (',', ':')
+_log_json = json.JSONEncoder(separators=JSON_SEPARATORS).encode
+
+# USDT-M futures symbol, e.g. BTCUSDT or 1000PEPEUSDT
+_SYMBOL_RE = re.compile(r'^[A-Z0-9]{2,10}USDT$')
+
+# Price fields each order type needs besides symbol, side and quantity,
+# as (input field, order key)
+ORDER_TYPE_FIELDS = {
+    "MARKET": (),
+    "LIMIT": (('price', 'price'),),
+    "STOP_MARKET": (('stop_price', 'stop_price'),),
+    "OCO": (('oco_limit_price', 'limit_price'),
+            ('oco_stop_price', 'stop_price'),
+            ('oco_stop_limit_price', 'stop_limit_price')),
+}
+
+
+def _parse_symbol(value):
+    """Parse a trading symbol entry"""
+    symbol = value.strip().upper()
+    if not _SYMBOL_RE.match(symbol):
+        raise ValueError("Symbol must be 2-10 letters or digits followed by USDT")
+    return symbol
+
+
+def _parse_side(value):
+    """Parse an order side entry"""
+    if value not in ('BUY', 'SELL'):
+        raise ValueError("Side must be BUY or SELL")
+    return value
+
+
+def _positive_float(label):
+    """Return a parser for an entry that must hold a number greater than 0"""
+    def parse(value):
+        try:
+            number = float(value)
+        except ValueError:
+            raise ValueError(f"{label} must be a number") from None
+        if number <= 0:
+            raise ValueError(f"{label} must be greater than 0")
+        return number
+    return parse
+
+# Full GUI log history, written by a background thread
+LOG_FILE = 'logs/gui.log'
+LOG_FLUSH_EVERY = 50
+
+
 class BasicBotGUI:
     """Modern GUI for BasicBot"""
     
@@ -20,24 +89,88 @@ class BasicBotGUI:
         self.root.geometry("800x700")
         self.root.resizable(True, True)
         
+        # Log lines waiting to be written to the log area by _write_log_lines
+        self._log_queue = deque(maxlen=LOG_MAX_LINES)
+        # (callback, args) posted by worker threads, run by _run_ui_calls
+        self._ui_calls = deque()
+        self._ui_calls_pending = False
+        self._flush_pending = False
+        # Adaptive flush delay, from a moving average of how late flushes run
+        self._flush_ms = LOG_FLUSH_MS
+        self._flush_late_ms = 0.0
+        self._flush_due_at = 0.0
+        # (second, "HH:MM:SS") of the last log timestamp, reused within the same second
+        self._log_time = (0, "")
+        # Lines waiting to be appended to LOG_FILE by _log_writer
+        self._log_file_q = queue.Queue()
+        threading.Thread(target=self._log_writer, daemon=True).start()
+        
         # Setup GUI (including log area) first
         self.setup_gui()
         self.setup_log_area()
         
-        # Initialize bot
+        # Initialize bot; one instance is kept per demo-mode setting
         self.bot = None
+        self._bots = {}
+        self._bots_loading = set()
+        self._order_in_flight = False
+        
+        # Inputs are validated as they are edited; self._parsed holds the
+        # order to submit, or None while any required field is invalid
+        self._parsed = None
+        self.setup_live_validation()
+        
         self.setup_bot()
     
     def setup_bot(self):
-        """Initialize the BasicBot"""
+        """
+        Select the BasicBot for the current demo-mode setting
+        
+        An existing instance is reused; otherwise one is built in a background
+        thread so the window stays responsive, and orders are disabled until
+        it is ready.
+        """
+        demo = self.demo_mode_var.get()
+        if demo in self._bots:
+            self.bot = self._bots[demo]
+            self._update_submit_state()
+            self.status_var.set("Ready")
+            return
+        
+        self.bot = None
+        self._update_submit_state()
+        self.status_var.set("Initializing...")
+        if demo not in self._bots_loading:
+            self._bots_loading.add(demo)
+            threading.Thread(target=self._async_setup_bot, args=(demo,), daemon=True).start()
+    
+    def _async_setup_bot(self, demo):
+        """Build a BasicBot in a worker thread and hand it to the main thread"""
         try:
-            self.bot = BasicBot(demo=self.demo_mode_var.get())
-            self.log_message("✅ BasicBot initialized successfully")
+            bot = BasicBot(demo=demo)
         except Exception as e:
-            # If log_text is not ready, just show a messagebox
-            if hasattr(self, 'log_text'):
-                self.log_message(f"❌ Error initializing BasicBot: {str(e)}")
-            messagebox.showerror("Error", f"Failed to initialize BasicBot:\n{str(e)}")
+            self._post_to_ui(self._on_bot_ready, demo, None, str(e))
+        else:
+            self._post_to_ui(self._on_bot_ready, demo, bot, None)
+    
+    def _on_bot_ready(self, demo, bot, error_msg):
+        """Handle a finished BasicBot construction in the main thread"""
+        self._bots_loading.discard(demo)
+        # Demo mode may have been toggled while this bot was being built
+        current = demo == self.demo_mode_var.get()
+        if bot is None:
+            self.log_message(f"❌ Error initializing BasicBot: {error_msg}")
+            if current:
+                self.status_var.set("Initialization failed")
+                messagebox.showerror("Error", f"Failed to initialize BasicBot:\n{error_msg}")
+            return
+        
+        self._bots[demo] = bot
+        self.log_message("✅ BasicBot initialized successfully")
+        if current:
+            self.bot = bot
+            self._update_submit_state()
+            self.status_var.set("Ready")
     
     def setup_gui(self):
         """Setup the main GUI components"""
@@ -99,9 +232,12 @@ class BasicBotGUI:
         self.stop_price_label = ttk.Label(main_frame, text="Stop Price:", font=("Arial", 12, "bold"))
         self.stop_price_var = tk.StringVar(value="45000")
         self.stop_price_entry = ttk.Entry(main_frame, textvariable=self.stop_price_var, width=20)
+        self.stop_price_label.grid(row=5, column=0, sticky=tk.W, pady=5)
+        self.stop_price_entry.grid(row=5, column=1, sticky=tk.W, pady=5)
         
         # OCO Order Fields
         self.oco_frame = ttk.LabelFrame(main_frame, text="OCO Order Settings", padding="10")
+        self.oco_frame.grid(row=5, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=10)
         
         # Limit Price for OCO
         ttk.Label(self.oco_frame, text="Limit Price:", font=("Arial", 10, "bold")).grid(row=0, column=0, sticky=tk.W, pady=2)
@@ -141,6 +277,21 @@ class BasicBotGUI:
                                font=("Arial", 10), foreground="green")
         status_label.grid(row=7, column=0, columnspan=3, pady=10)
         
+        # Why Place Order is disabled, while any input is invalid
+        self.input_error_var = tk.StringVar()
+        ttk.Label(main_frame, textvariable=self.input_error_var,
+                  font=("Arial", 10), foreground="red").grid(row=8, column=0, columnspan=3)
+        
+        # Optional fields shown for each order type; grid_remove keeps their grid
+        # options so a bare grid() call restores them later
+        self._order_type_widgets = {
+            "MARKET": frozenset(),
+            "LIMIT": frozenset((self.price_label, self.price_entry)),
+            "STOP_MARKET": frozenset((self.stop_price_label, self.stop_price_entry)),
+            "OCO": frozenset((self.oco_frame,)),
+        }
+        self._visible = set().union(*self._order_type_widgets.values())
+        
         # Initialize visibility
         self.on_order_type_change()
     
@@ -156,7 +307,8 @@ class BasicBotGUI:
         log_frame.rowconfigure(0, weight=1)
         
         # Log Text Area
-        self.log_text = scrolledtext.ScrolledText(log_frame, height=15, width=80)
+        # Read-only; _write_log_lines and clear_logs enable it briefly to edit
+        self.log_text = scrolledtext.ScrolledText(log_frame, height=15, width=80, state='disabled')
         self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Initial log message
@@ -164,122 +316,193 @@ class BasicBotGUI:
         self.log_message("📋 Configure your order settings above")
     
     def on_order_type_change(self, event=None):
-        """Handle order type change"""
-        order_type = self.order_type_var.get()
-        
-        # Hide all optional fields
-        self.price_label.grid_remove()
-        self.price_entry.grid_remove()
-        self.stop_price_label.grid_remove()
-        self.stop_price_entry.grid_remove()
-        self.oco_frame.grid_remove()
-        
-        # Show relevant fields based on order type
-        if order_type == "LIMIT":
-            self.price_label.grid()
-            self.price_entry.grid()
-        elif order_type == "STOP_MARKET":
-            self.stop_price_label.grid()
-            self.stop_price_entry.grid()
-        elif order_type == "OCO":
-            self.oco_frame.grid(row=5, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=10)
+        """Handle order type change, only toggling fields whose visibility changes"""
+        desired = self._order_type_widgets[self.order_type_var.get()]
+        
+        for widget in self._visible - desired:
+            widget.grid_remove()
+        for widget in desired - self._visible:
+            widget.grid()
+        self._visible = set(desired)
     
     def log_message(self, message):
-        """Add message to log area"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        """Queue message for the log area; queued lines are written together at most once per frame"""
+        second = int(time.time())
+        cached_second, timestamp = self._log_time
+        if second != cached_second:
+            timestamp = time.strftime("%H:%M:%S", time.localtime(second))
+            # One tuple assignment so threads never see a mismatched pair
+            self._log_time = (second, timestamp)
         log_entry = f"[{timestamp}] {message}\n"
+        self._log_file_q.put(log_entry)
+        self._log_queue.append(log_entry)
+        self._schedule_flush()
+    
+    def _post_to_ui(self, callback, *args):
+        """Run callback(*args) in the main thread as soon as it is idle (safe from worker threads)"""
+        self._ui_calls.append((callback, args))
+        if not self._ui_calls_pending:
+            self._ui_calls_pending = True
+            self.root.after(0, self._run_ui_calls)
+    
+    def _run_ui_calls(self):
+        """Run callbacks posted by worker threads, then write the lines they logged"""
+        # Cleared first so callbacks posted while running schedule another run
+        self._ui_calls_pending = False
+        while self._ui_calls:
+            callback, args = self._ui_calls.popleft()
+            try:
+                callback(*args)
+            except Exception:
+                # Report like any Tk callback error, then keep draining the queue
+                self.root.report_callback_exception(*sys.exc_info())
+        self._write_log_lines()
+    
+    def _schedule_flush(self):
+        """Schedule _flush_ui unless a flush is already pending"""
+        if not self._flush_pending:
+            self._flush_pending = True
+            self._flush_due_at = time.perf_counter() + self._flush_ms / 1000
+            self.root.after(self._flush_ms, self._flush_ui)
+    
+    def _log_writer(self):
+        """Append log lines to LOG_FILE (runs in a background thread, never touches Tk)"""
+        os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
+        with open(LOG_FILE, 'a', encoding='utf-8') as log_file:
+            unflushed = 0
+            while True:
+                log_file.write(self._log_file_q.get())
+                unflushed += 1
+                # Flush in batches, and whenever the writer catches up
+                if unflushed >= LOG_FLUSH_EVERY or self._log_file_q.empty():
+                    log_file.flush()
+                    unflushed = 0
+    
+    def _flush_ui(self):
+        """Write all queued log lines, adapting the flush delay to main loop load"""
+        # Cleared first so work queued while flushing schedules another flush
+        self._flush_pending = False
+        
+        # Measure how late this flush ran, excluding the requested delay so
+        # the average recovers once the main loop catches up, and back off
+        # the delay while it cannot keep up
+        late_ms = (time.perf_counter() - self._flush_due_at) * 1000
+        self._flush_late_ms += LOG_FLUSH_EMA_ALPHA * (late_ms - self._flush_late_ms)
+        self._flush_ms = LOG_FLUSH_SLOW_MS if self._flush_late_ms > LOG_FLUSH_SATURATED_MS else LOG_FLUSH_MS
+        self._write_log_lines()
+    
+    def _write_log_lines(self):
+        """Write all queued log lines to the log area with a single insert"""
+        batch = []
+        while self._log_queue:
+            batch.append(self._log_queue.popleft())
+        if not batch:
+            return
         
-        self.log_text.insert(tk.END, log_entry)
-        self.log_text.see(tk.END)
-        
-        # Limit log size
-        lines = self.log_text.get("1.0", tk.END).split('\n')
-        if len(lines) > 1000:
-            self.log_text.delete("1.0", "100.0")
+        # Only follow new lines if the user has not scrolled up to read history
+        at_bottom = self.log_text.yview()[1] > 0.999
+        self.log_text.configure(state='normal')
+        self.log_text.insert(tk.END, "".join(batch))
+        if at_bottom:
+            self.log_text.see(tk.END)
+        
+        # Limit log size using the widget's own line index. The text ends
+        # with a newline, so the last line ('end-1c') is always empty.
+        line_count = int(self.log_text.index('end-1c').split('.')[0])
+        if line_count > LOG_MAX_LINES + 1:
+            self.log_text.delete("1.0", f"{line_count - LOG_MAX_LINES}.0")
+        self.log_text.configure(state='disabled')
     
     def clear_logs(self):
         """Clear the log area"""
+        self._log_queue.clear()
+        self.log_text.configure(state='normal')
         self.log_text.delete("1.0", tk.END)
+        self.log_text.configure(state='disabled')
         self.log_message("📝 Logs cleared")
     
-    def validate_inputs(self):
-        """Validate all input fields"""
+    def setup_live_validation(self):
+        """Re-parse each input field whenever its variable is written"""
+        fields = {
+            'symbol': (self.symbol_var, _parse_symbol),
+            'side': (self.side_var, _parse_side),
+            'quantity': (self.quantity_var, _positive_float("Quantity")),
+            'price': (self.price_var, _positive_float("Price")),
+            'stop_price': (self.stop_price_var, _positive_float("Stop price")),
+            'oco_limit_price': (self.oco_limit_price_var, _positive_float("OCO limit price")),
+            'oco_stop_price': (self.oco_stop_price_var, _positive_float("OCO stop price")),
+            'oco_stop_limit_price': (self.oco_stop_limit_price_var, _positive_float("OCO stop limit price")),
+        }
+        # field name -> (parsed value, None) or (None, error message)
+        self._fields = {}
+        for name, (var, parse) in fields.items():
+            var.trace_add("write", lambda *_, n=name, v=var, p=parse: self._validate_field(n, v, p))
+            self._validate_field(name, var, parse, update=False)
+        self.order_type_var.trace_add("write", lambda *_: self._update_submit_state())
+        self._update_submit_state()
+    
+    def _validate_field(self, name, var, parse, update=True):
+        """Parse a single input field and refresh the submit state"""
         try:
-            # Validate symbol
-            symbol = self.symbol_var.get().strip().upper()
-            if not symbol or not symbol.endswith('USDT'):
-                raise ValueError("Symbol must end with USDT")
-            
-            # Validate side
-            side = self.side_var.get()
-            if side not in ['BUY', 'SELL']:
-                raise ValueError("Side must be BUY or SELL")
-            
-            # Validate quantity
-            quantity = float(self.quantity_var.get())
-            if quantity <= 0:
-                raise ValueError("Quantity must be greater than 0")
-            
-            # Validate order type specific fields
-            order_type = self.order_type_var.get()
-            
-            if order_type == "LIMIT":
-                price = float(self.price_var.get())
-                if price <= 0:
-                    raise ValueError("Price must be greater than 0")
-            
-            elif order_type == "STOP_MARKET":
-                stop_price = float(self.stop_price_var.get())
-                if stop_price <= 0:
-                    raise ValueError("Stop price must be greater than 0")
-            
-            elif order_type == "OCO":
-                limit_price = float(self.oco_limit_price_var.get())
-                stop_price = float(self.oco_stop_price_var.get())
-                stop_limit_price = float(self.oco_stop_limit_price_var.get())
-                
-                if limit_price <= 0 or stop_price <= 0 or stop_limit_price <= 0:
-                    raise ValueError("All OCO prices must be greater than 0")
-                
-                if side == "BUY":
-                    if limit_price <= stop_price:
-                        raise ValueError("For BUY orders: Limit price should be higher than stop price")
-                else:  # SELL
-                    if limit_price >= stop_price:
-                        raise ValueError("For SELL orders: Limit price should be lower than stop price")
-            
-            return True
-            
+            self._fields[name] = (parse(var.get()), None)
         except ValueError as e:
-            messagebox.showerror("Validation Error", str(e))
-            return False
-        except Exception as e:
-            messagebox.showerror("Error", f"Unexpected error: {str(e)}")
-            return False
+            self._fields[name] = (None, str(e))
+        if update:
+            self._update_submit_state()
+    
+    def _build_order(self):
+        """Assemble the order from the parsed fields, raising ValueError for the first invalid one"""
+        order_type = self.order_type_var.get()
+        parsed = {'order_type': order_type}
+        for name, key in (('symbol', 'symbol'), ('side', 'side'), ('quantity', 'quantity')) + ORDER_TYPE_FIELDS[order_type]:
+            value, error = self._fields[name]
+            if error:
+                raise ValueError(error)
+            parsed[key] = value
+        
+        if order_type == "OCO":
+            # BUY needs limit above stop, SELL needs it below
+            limit_price, stop_price = parsed['limit_price'], parsed['stop_price']
+            expect_higher = parsed['side'] == "BUY"
+            if limit_price == stop_price or (limit_price > stop_price) != expect_higher:
+                relation = "higher" if expect_higher else "lower"
+                raise ValueError(f"For {parsed['side']} orders: Limit price should be {relation} than stop price")
+        
+        return parsed
+    
+    def _update_submit_state(self):
+        """Rebuild self._parsed and enable Place Order only when an order can be sent"""
+        try:
+            self._parsed = self._build_order()
+            self.input_error_var.set("")
+        except ValueError as e:
+            self._parsed = None
+            self.input_error_var.set(f"⚠️ {e}")
+        
+        ready = self._parsed is not None and self.bot is not None and not self._order_in_flight
+        self.place_order_btn.config(state="normal" if ready else "disabled")
     
     def place_order(self):
         """Place the order based on current settings"""
-        if not self.validate_inputs():
-            return
-        
         if not self.bot:
             messagebox.showerror("Error", "BasicBot not initialized")
             return
         
         # Disable button during order placement
-        self.place_order_btn.config(state="disabled")
+        self._order_in_flight = True
+        self._update_submit_state()
         self.status_var.set("Placing order...")
         
-        # Run order placement in separate thread
-        threading.Thread(target=self._place_order_thread, daemon=True).start()
+        # Run order placement in separate thread, on the values validated as they were typed
+        threading.Thread(target=self._place_order_thread, args=(self._parsed,), daemon=True).start()
     
-    def _place_order_thread(self):
+    def _place_order_thread(self, order):
         """Place order in separate thread"""
         try:
-            order_type = self.order_type_var.get()
-            symbol = self.symbol_var.get().strip().upper()
-            side = self.side_var.get()
-            quantity = float(self.quantity_var.get())
+            order_type = order['order_type']
+            symbol = order['symbol']
+            side = order['side']
+            quantity = order['quantity']
             
             self.log_message(f"📤 Placing {order_type} order: {side} {quantity} {symbol}")
             
@@ -287,44 +510,41 @@ class BasicBotGUI:
                 result = self.bot.place_market_order(symbol, side, quantity)
             
             elif order_type == "LIMIT":
-                price = float(self.price_var.get())
-                result = self.bot.place_limit_order(symbol, side, quantity, price)
+                result = self.bot.place_limit_order(symbol, side, quantity, order['price'])
             
             elif order_type == "STOP_MARKET":
-                stop_price = float(self.stop_price_var.get())
-                result = self.bot.place_stop_market_order(symbol, side, quantity, stop_price)
+                result = self.bot.place_stop_market_order(symbol, side, quantity, order['stop_price'])
             
             elif order_type == "OCO":
-                limit_price = float(self.oco_limit_price_var.get())
-                stop_price = float(self.oco_stop_price_var.get())
-                stop_limit_price = float(self.oco_stop_limit_price_var.get())
-                result = self.bot.place_oco_order(symbol, side, quantity, limit_price, stop_price, stop_limit_price)
+                result = self.bot.place_oco_order(symbol, side, quantity, order['limit_price'],
+                                                  order['stop_price'], order['stop_limit_price'])
             
             else:
                 raise ValueError(f"Unsupported order type: {order_type}")
             
-            # Update GUI in main thread
-            self.root.after(0, self._handle_order_result, result)
+            # Serialize here so the main thread only has to display it
+            result_str = _log_json(result)
+            
+            # Update GUI in main thread with the next flush
+            self._post_to_ui(self._handle_order_result, result, result_str)
             
         except Exception as e:
-            self.root.after(0, self._handle_order_error, str(e))
+            self._post_to_ui(self._handle_order_error, str(e))
     
-    def _handle_order_result(self, result):
-        """Handle order result in main thread"""
-        self.place_order_btn.config(state="normal")
-        
-        # Debug logging
-        self.log_message(f"🔍 Debug: Received result: {result}")
+    def _handle_order_result(self, result, result_str):
+        """Handle order result in main thread (result_str is the result pre-serialized by the worker)"""
+        self._order_in_flight = False
+        self._update_submit_state()
         
         if result.get('status') == 'SUCCESS':
             self.status_var.set("Order placed successfully")
-            self.log_message("✅ Order placed successfully!")
-            self.log_message(f"📋 Order ID: {result.get('order_id', 'N/A')}")
-            self.log_message(f"💰 Price: {result.get('price', 'N/A')}")
-            
-            # Show detailed result
-            result_str = json.dumps(result, indent=2)
-            self.log_message(f"📄 Full Response:\n{result_str}")
+            # One log entry for the whole report, including the detailed result
+            self.log_message(
+                f"✅ Order placed successfully!\n"
+                f"📋 Order ID: {result.get('order_id', 'N/A')}\n"
+                f"💰 Price: {result.get('price', 'N/A')}\n"
+                f"📄 Full Response: {result_str}"
+            )
             
             messagebox.showinfo("Success", "Order placed successfully!")
         else:
@@ -335,7 +555,8 @@ class BasicBotGUI:
     
     def _handle_order_error(self, error_msg):
         """Handle order error in main thread"""
-        self.place_order_btn.config(state="normal")
+        self._order_in_flight = False
+        self._update_submit_state()
         self.status_var.set("Order failed")
         self.log_message(f"❌ Error: {error_msg}")
         messagebox.showerror("Error", f"Order failed:\n{error_msg}")
@@ -351,27 +572,26 @@ class BasicBotGUI:
         def fetch_account_info():
             try:
                 result = self.bot.get_account_info()
-                self.root.after(0, self._handle_account_info, result)
+                result_str = _log_json(result)
+                self._post_to_ui(self._handle_account_info, result, result_str)
             except Exception as e:
-                self.root.after(0, self._handle_account_error, str(e))
+                self._post_to_ui(self._handle_account_error, str(e))
         
         threading.Thread(target=fetch_account_info, daemon=True).start()
     
-    def _handle_account_info(self, result):
-        """Handle account info result"""
+    def _handle_account_info(self, result, result_str):
+        """Handle account info result (result_str is the result pre-serialized by the worker)"""
         if result.get('status') == 'SUCCESS':
-            self.log_message("✅ Account information retrieved")
             account_info = result.get('account_info', {})
             
-            # Display key account information
-            if 'totalWalletBalance' in account_info:
-                self.log_message(f"💰 Total Balance: {account_info['totalWalletBalance']}")
-            if 'totalUnrealizedProfit' in account_info:
-                self.log_message(f"📈 Unrealized P&L: {account_info['totalUnrealizedProfit']}")
-            
-            # Show full response in log
-            result_str = json.dumps(result, indent=2)
-            self.log_message(f"📄 Full Account Info:\n{result_str}")
+            # Key account information, then the full response on one line
+            self.log_message(
+                f"✅ Account information retrieved\n"
+                f"💰 Total Balance: {account_info.get('totalWalletBalance', 'N/A')}\n"
+                f"📈 Unrealized P&L: {account_info.get('totalUnrealizedProfit', 'N/A')}\n"
+                f"🪙 Assets: {len(account_info.get('assets', []))}"
+            )
+            self.log_message(f"📄 Full Account Info: {result_str}")
         else:
             error_msg = result.get('error', 'Unknown error')
             self.log_message(f"❌ Failed to get account info: {error_msg}")
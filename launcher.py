@@ -6,6 +6,7 @@ Launcher script for BasicBot - Choose between CLI and GUI modes
 import sys
 import subprocess
 import os
+import importlib.util
 
 
 def main():
@@ -51,6 +52,11 @@ def main():
                 break
                 
             elif choice == "4":
+                # pytest is a development dependency, not installed by setup.py
+                if importlib.util.find_spec("pytest") is None:
+                    print("❌ Error: pytest is not installed")
+                    print("Install the test dependencies with: pip install -r requirements-dev.txt")
+                    break
                 print("Running tests...")
                 try:
                     subprocess.run([sys.executable, "test_bot.py"], check=True)
@@ -84,7 +84,7 @@ def main():
     print("1. Get your API credentials from https://testnet.binancefuture.com/")
     print("2. Edit the .env file with your actual API credentials")
     print("3. Run: python example_usage.py")
-    print("4. Or run: python test_bot.py to run tests")
+    print("4. Or run: pip install -r requirements-dev.txt && python test_bot.py to run tests")
     print("\n📚 For more information, see README.md")
 
 
@@ -3,228 +3,759 @@
 Test script for BasicBot functionality
 """
 
-import unittest
+import sys
+import hmac
+import json
+import socket
+import asyncio
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from collections import deque
+from types import SimpleNamespace
+from urllib.parse import urlencode
 from unittest.mock import Mock, patch
-from basic_bot import BasicBot
-
-
-class TestBasicBot(unittest.TestCase):
-    """Test cases for BasicBot class"""
-    
-    def setUp(self):
-        """Set up test fixtures"""
-        # Mock API credentials for testing
-        self.api_key = "test_api_key"
-        self.api_secret = "test_api_secret"
-        
-        # Mock the Binance client
-        with patch('basic_bot.Client') as mock_client:
-            self.mock_client = mock_client.return_value
-            self.bot = BasicBot(self.api_key, self.api_secret)
-    
-    def test_validate_symbol(self):
-        """Test symbol validation"""
-        # Valid symbols
-        self.assertEqual(self.bot._validate_symbol("BTCUSDT"), "BTCUSDT")
-        self.assertEqual(self.bot._validate_symbol("ethusdt"), "ETHUSDT")
-        self.assertEqual(self.bot._validate_symbol("  btcusdt  "), "BTCUSDT")
-        
-        # Invalid symbols
-        with self.assertRaises(ValueError):
-            self.bot._validate_symbol("")
-        with self.assertRaises(ValueError):
-            self.bot._validate_symbol("BTC")
-        with self.assertRaises(ValueError):
-            self.bot._validate_symbol("BTCUSD")
-    
-    def test_validate_side(self):
-        """Test side validation"""
-        # Valid sides
-        self.assertEqual(self.bot._validate_side("BUY"), "BUY")
-        self.assertEqual(self.bot._validate_side("SELL"), "SELL")
-        self.assertEqual(self.bot._validate_side("buy"), "BUY")
-        self.assertEqual(self.bot._validate_side("sell"), "SELL")
-        
-        # Invalid sides
-        with self.assertRaises(ValueError):
-            self.bot._validate_side("INVALID")
-        with self.assertRaises(ValueError):
-            self.bot._validate_side("")
-    
-    def test_validate_quantity(self):
-        """Test quantity validation"""
-        # Valid quantities
-        self.assertEqual(self.bot._validate_quantity(0.001), 0.001)
-        self.assertEqual(self.bot._validate_quantity(1.0), 1.0)
-        self.assertEqual(self.bot._validate_quantity(100), 100)
-        
-        # Invalid quantities
-        with self.assertRaises(ValueError):
-            self.bot._validate_quantity(0)
-        with self.assertRaises(ValueError):
-            self.bot._validate_quantity(-1)
-    
-    def test_validate_price(self):
-        """Test price validation"""
-        # Valid prices
-        self.assertEqual(self.bot._validate_price(50000), 50000)
-        self.assertEqual(self.bot._validate_price(0.001), 0.001)
-        
-        # Invalid prices
-        with self.assertRaises(ValueError):
-            self.bot._validate_price(0)
-        with self.assertRaises(ValueError):
-            self.bot._validate_price(-1)
-    
-    def test_place_market_order_success(self):
-        """Test successful market order placement"""
-        # Mock successful response
-        mock_response = {
-            'orderId': 123456789,
-            'clientOrderId': 'test123',
-            'avgPrice': '50000.00',
-            'status': 'FILLED'
-        }
-        self.mock_client.futures_create_order.return_value = mock_response
-        
-        result = self.bot.place_market_order("BTCUSDT", "BUY", 0.001)
-        
-        # Verify the result
-        self.assertEqual(result['status'], 'SUCCESS')
-        self.assertEqual(result['order_type'], 'MARKET')
-        self.assertEqual(result['symbol'], 'BTCUSDT')
-        self.assertEqual(result['side'], 'BUY')
-        self.assertEqual(result['quantity'], 0.001)
-        self.assertEqual(result['order_id'], 123456789)
-        
-        # Verify the API call
-        self.mock_client.futures_create_order.assert_called_once_with(
-            symbol='BTCUSDT',
-            side='BUY',
-            type='MARKET',
-            quantity=0.001
-        )
-    
-    def test_place_limit_order_success(self):
-        """Test successful limit order placement"""
-        # Mock successful response
-        mock_response = {
-            'orderId': 123456789,
-            'clientOrderId': 'test123',
-            'status': 'NEW'
-        }
-        self.mock_client.futures_create_order.return_value = mock_response
-        
-        result = self.bot.place_limit_order("BTCUSDT", "SELL", 0.001, 50000)
-        
-        # Verify the result
-        self.assertEqual(result['status'], 'SUCCESS')
-        self.assertEqual(result['order_type'], 'LIMIT')
-        self.assertEqual(result['symbol'], 'BTCUSDT')
-        self.assertEqual(result['side'], 'SELL')
-        self.assertEqual(result['quantity'], 0.001)
-        self.assertEqual(result['price'], 50000)
-        
-        # Verify the API call
-        self.mock_client.futures_create_order.assert_called_once_with(
-            symbol='BTCUSDT',
-            side='SELL',
-            type='LIMIT',
-            timeInForce='GTC',
-            quantity=0.001,
-            price=50000
-        )
-    
-    def test_place_stop_market_order_success(self):
-        """Test successful stop market order placement"""
-        # Mock successful response
-        mock_response = {
-            'orderId': 123456789,
-            'clientOrderId': 'test123',
-            'status': 'NEW'
-        }
-        self.mock_client.futures_create_order.return_value = mock_response
-        
-        result = self.bot.place_stop_market_order("BTCUSDT", "SELL", 0.001, 45000)
-        
-        # Verify the result
-        self.assertEqual(result['status'], 'SUCCESS')
-        self.assertEqual(result['order_type'], 'STOP_MARKET')
-        self.assertEqual(result['symbol'], 'BTCUSDT')
-        self.assertEqual(result['side'], 'SELL')
-        self.assertEqual(result['quantity'], 0.001)
-        self.assertEqual(result['stop_price'], 45000)
-        
-        # Verify the API call
-        self.mock_client.futures_create_order.assert_called_once_with(
-            symbol='BTCUSDT',
-            side='SELL',
-            type='STOP_MARKET',
-            quantity=0.001,
-            stopPrice=45000
-        )
-    
-    def test_place_oco_order_success(self):
-        """Test successful OCO order placement"""
-        # Mock successful response
-        mock_response = {
-            'orderListId': 123456789,
-            'contingencyType': 'OCO',
-            'listStatusType': 'RESPONSE',
-            'listOrderStatus': 'EXEC_STARTED',
-            'listClientOrderId': 'test123'
-        }
-        self.mock_client.futures_create_oco_order.return_value = mock_response
-        
-        result = self.bot.place_oco_order("BTCUSDT", "SELL", 0.001, 50000, 45000, 44900)
-        
-        # Verify the result
-        self.assertEqual(result['status'], 'SUCCESS')
-        self.assertEqual(result['order_type'], 'OCO')
-        self.assertEqual(result['symbol'], 'BTCUSDT')
-        self.assertEqual(result['side'], 'SELL')
-        self.assertEqual(result['quantity'], 0.001)
-        self.assertEqual(result['limit_price'], 50000)
-        self.assertEqual(result['stop_price'], 45000)
-        self.assertEqual(result['stop_limit_price'], 44900)
-        
-        # Verify the API call
-        self.mock_client.futures_create_oco_order.assert_called_once_with(
-            symbol='BTCUSDT',
-            side='SELL',
-            quantity=0.001,
-            price=50000,
-            stopPrice=45000,
-            stopLimitPrice=44900,
-            stopLimitTimeInForce='GTC'
-        )
-    
-    def test_api_error_handling(self):
-        """Test API error handling"""
-        # Mock API error
-        from binance.exceptions import BinanceAPIException
-        mock_response = Mock()
-        mock_response.status_code = 400
-        mock_response.text = '{"code": -1013, "msg": "Invalid symbol."}'
-        
-        self.mock_client.futures_create_order.side_effect = BinanceAPIException(
-            response=mock_response,
-            status_code=400,
-            text='{"code": -1013, "msg": "Invalid symbol."}'
-        )
-        
-        result = self.bot.place_market_order("INVALID", "BUY", 0.001)
-        
-        # Verify error handling
-        self.assertEqual(result['status'], 'ERROR')
-        self.assertIn('error', result)
-
-
-def run_tests():
-    """Run all tests"""
-    print("Running BasicBot tests...")
-    unittest.main(verbosity=2)
 
+import pytest
+import requests
+import websockets
+from binance.exceptions import BinanceAPIException
+
+import basic_bot
+from basic_bot import BasicBot, FastFormatter
+from gui_bot import BasicBotGUI, _parse_symbol, _positive_float
+
+
+pytestmark = pytest.mark.unit
+
+# Mock API credentials for testing
+API_KEY = "test_api_key"
+API_SECRET = "test_api_secret"
+
+# The Binance client methods BasicBot uses; FakeClient has no others, so
+# an unexpected call raises AttributeError
+CLIENT_METHODS = (
+    'futures_ping',
+    'futures_time',
+    'futures_account',
+    'futures_create_order',
+    'futures_create_oco_order',
+    'futures_get_order',
+    'futures_place_batch_order',
+)
+
+# Canned exchange responses; BasicBot only reads them, so tests share one copy
+_MARKET_OK = {'orderId': 123456789, 'clientOrderId': 'test123', 'avgPrice': '50000.00', 'status': 'FILLED'}
+_LIMIT_OK = {'orderId': 123456789, 'clientOrderId': 'test123', 'status': 'NEW'}
+_STOP_OK = _LIMIT_OK
+_OCO_OK = {
+    'orderListId': 123456789,
+    'contingencyType': 'OCO',
+    'listStatusType': 'RESPONSE',
+    'listOrderStatus': 'EXEC_STARTED',
+    'listClientOrderId': 'test123'
+}
+
+
+class _Recorder:
+    """Stand-in for one client method: records each call's keyword arguments"""
+    
+    def __init__(self):
+        self.calls = []
+        self.result = None
+        self.exc = None
+    
+    def configure(self, result=None, exc=None):
+        """Set what later calls return, or the exception they raise"""
+        self.result = result
+        self.exc = exc
+    
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.exc is not None:
+            raise self.exc
+        return self.result
+
+
+class FakeClient:
+    """Lightweight python-binance Client replacement with a real requests session"""
+    
+    def __init__(self, *args, **kwargs):
+        self.session = requests.Session()
+        self.reset()
+    
+    def reset(self):
+        """Forget recorded calls and configured results"""
+        for name in CLIENT_METHODS:
+            setattr(self, name, _Recorder())
+
+
+@pytest.fixture(scope="module")
+def bot_and_client():
+    """One BasicBot for the whole module, built against a fake Binance client"""
+    with patch('basic_bot.Client', FakeClient):
+        bot = BasicBot(API_KEY, API_SECRET)
+        yield bot, bot.client
+    bot.close()
+
+
+@pytest.fixture(autouse=True)
+def reset_bot(request):
+    """Reset the shared bot's client and per-test state so tests stay isolated"""
+    if 'bot' not in request.fixturenames:
+        return
+    bot, fake_client = request.getfixturevalue('bot_and_client')
+    fake_client.reset()
+    bot._ws = None
+    bot._order_template_cache.clear()
+
+
+@pytest.fixture
+def bot(bot_and_client):
+    """The shared BasicBot"""
+    return bot_and_client[0]
+
+
+@pytest.fixture
+def fake_client(bot_and_client):
+    """The fake Binance client behind the shared BasicBot"""
+    return bot_and_client[1]
+
+
+@pytest.mark.parametrize("raw,expected", [
+    ("BTCUSDT", "BTCUSDT"),
+    ("ethusdt", "ETHUSDT"),
+    ("  btcusdt  ", "BTCUSDT"),
+])
+def test_validate_symbol_ok(bot, raw, expected):
+    """Test valid symbols are normalized"""
+    assert bot._validate_symbol(raw) == expected
+
+
+@pytest.mark.parametrize("raw,match", [
+    pytest.param("", "cannot be empty", id="empty"),
+    pytest.param("BTC", "must end with USDT", id="too-short"),
+    pytest.param("BTCUSD", "must end with USDT", id="wrong-quote"),
+])
+def test_validate_symbol_bad(bot, raw, match):
+    """Test invalid symbols are rejected"""
+    with pytest.raises(ValueError, match=match):
+        bot._validate_symbol(raw)
+
+
+@pytest.mark.parametrize("raw,expected", [
+    ("BUY", "BUY"),
+    ("SELL", "SELL"),
+    ("buy", "BUY"),
+    ("sell", "SELL"),
+])
+def test_validate_side_ok(bot, raw, expected):
+    """Test valid sides are normalized"""
+    assert bot._validate_side(raw) == expected
+
+
+@pytest.mark.parametrize("raw", [
+    pytest.param("INVALID", id="unknown"),
+    pytest.param("", id="empty"),
+])
+def test_validate_side_bad(bot, raw):
+    """Test invalid sides are rejected"""
+    with pytest.raises(ValueError, match="Side must be either"):
+        bot._validate_side(raw)
+
+
+@pytest.mark.parametrize("raw", [0.001, 1.0, 100])
+def test_validate_quantity_ok(bot, raw):
+    """Test positive quantities are accepted unchanged"""
+    assert bot._validate_quantity(raw) == raw
+
+
+@pytest.mark.parametrize("raw", [pytest.param(0, id="zero"), pytest.param(-1, id="negative")])
+def test_validate_quantity_bad(bot, raw):
+    """Test non-positive quantities are rejected"""
+    with pytest.raises(ValueError, match="Quantity must be greater than 0"):
+        bot._validate_quantity(raw)
+
+
+@pytest.mark.parametrize("raw", [50000, 0.001])
+def test_validate_price_ok(bot, raw):
+    """Test positive prices are accepted unchanged"""
+    assert bot._validate_price(raw) == raw
+
+
+@pytest.mark.parametrize("raw", [pytest.param(0, id="zero"), pytest.param(-1, id="negative")])
+def test_validate_price_bad(bot, raw):
+    """Test non-positive prices are rejected"""
+    with pytest.raises(ValueError, match="Price must be greater than 0"):
+        bot._validate_price(raw)
+
+
+@patch('basic_bot.Client', FakeClient)
+def test_rest_session_keep_alive():
+    """Test the REST session is configured for connection reuse"""
+    # Uses its own bot: construction-time calls are what is checked, and
+    # close() must not stop the shared bot
+    bot = BasicBot(API_KEY, API_SECRET)
+    
+    session = bot.client.session
+    assert session.headers["Connection"] == "keep-alive"
+    assert session.get_adapter("https://testnet.binancefuture.com")._pool_maxsize == 32
+    
+    # The connection is warmed up before the first order
+    assert bot.client.futures_ping.calls == [{}]
+    assert bot.client.futures_time.calls == [{}]
+    
+    # close() stops the keep-alive ping thread
+    bot.close()
+    assert bot._keepalive_stop.is_set()
+
+
+def returns(value):
+    """Client method behaviour: return value"""
+    return {'result': value}
+
+
+def raises(exc):
+    """Client method behaviour: raise exc"""
+    return {'exc': exc}
+
+
+def api_error():
+    """A BinanceAPIException as raised for a rejected order"""
+    # BinanceAPIException only reads attributes of the response
+    mock_response = SimpleNamespace(status_code=400, text='{"code": -1013, "msg": "Invalid symbol."}')
+    return BinanceAPIException(
+        response=mock_response,
+        status_code=400,
+        text='{"code": -1013, "msg": "Invalid symbol."}'
+    )
+
+
+API_ERROR = api_error()
+
+
+@pytest.mark.parametrize("behaviour,expected", [
+    pytest.param(returns(_MARKET_OK),
+                 {'status': 'SUCCESS', 'order_type': 'MARKET', 'symbol': 'BTCUSDT', 'side': 'BUY',
+                  'quantity': 0.001, 'order_id': 123456789},
+                 id="success"),
+    pytest.param(raises(API_ERROR), {'status': 'ERROR', 'error': str(API_ERROR)}, id="api-error",
+                 marks=pytest.mark.slow),
+])
+def test_place_market_order(bot, fake_client, behaviour, expected):
+    """Test market order placement and API error handling"""
+    fake_client.futures_create_order.configure(**behaviour)
+    
+    result = bot.place_market_order("BTCUSDT", "BUY", 0.001)
+    
+    # Verify the API call
+    assert fake_client.futures_create_order.calls == [{
+        'symbol': 'BTCUSDT',
+        'side': 'BUY',
+        'type': 'MARKET',
+        'quantity': 0.001
+    }]
+    
+    # Verify the result
+    assert expected.items() <= result.items()
+
+
+def test_order_templates_reused(bot, fake_client):
+    """Test order templates are cached per symbol/side/type and never mutated"""
+    fake_client.futures_create_order.configure(result={'orderId': 1, 'status': 'FILLED'})
+    
+    bot.place_market_order("BTCUSDT", "BUY", 0.001)
+    bot.place_market_order("btcusdt", "buy", 0.002)
+    
+    assert list(bot._order_template_cache) == [("BTCUSDT", "BUY", "MARKET")]
+    params, skeleton = bot._order_template_cache[("BTCUSDT", "BUY", "MARKET")]
+    assert params == {'symbol': 'BTCUSDT', 'side': 'BUY', 'type': 'MARKET'}
+    assert skeleton == {'status': 'SUCCESS', 'order_type': 'MARKET', 'symbol': 'BTCUSDT', 'side': 'BUY'}
+    assert fake_client.futures_create_order.calls[-1] == {
+        'symbol': 'BTCUSDT',
+        'side': 'BUY',
+        'type': 'MARKET',
+        'quantity': 0.002
+    }
+
+
+def test_place_limit_order_success(bot, fake_client):
+    """Test successful limit order placement"""
+    # Mock successful response
+    fake_client.futures_create_order.configure(result=_LIMIT_OK)
+    
+    result = bot.place_limit_order("BTCUSDT", "SELL", 0.001, 50000)
+    
+    # Verify the result
+    expected = {'status': 'SUCCESS', 'order_type': 'LIMIT', 'symbol': 'BTCUSDT', 'side': 'SELL',
+                'quantity': 0.001, 'price': 50000, 'order_id': 123456789}
+    assert expected.items() <= result.items()
+    
+    # Verify the API call
+    assert fake_client.futures_create_order.calls == [{
+        'symbol': 'BTCUSDT',
+        'side': 'SELL',
+        'type': 'LIMIT',
+        'timeInForce': 'GTC',
+        'quantity': 0.001,
+        'price': 50000
+    }]
+
+
+def test_place_stop_market_order_success(bot, fake_client):
+    """Test successful stop market order placement"""
+    # Mock successful response
+    fake_client.futures_create_order.configure(result=_STOP_OK)
+    
+    result = bot.place_stop_market_order("BTCUSDT", "SELL", 0.001, 45000)
+    
+    # Verify the result
+    expected = {'status': 'SUCCESS', 'order_type': 'STOP_MARKET', 'symbol': 'BTCUSDT', 'side': 'SELL',
+                'quantity': 0.001, 'stop_price': 45000, 'order_id': 123456789}
+    assert expected.items() <= result.items()
+    
+    # Verify the API call
+    assert fake_client.futures_create_order.calls == [{
+        'symbol': 'BTCUSDT',
+        'side': 'SELL',
+        'type': 'STOP_MARKET',
+        'quantity': 0.001,
+        'stopPrice': 45000
+    }]
+
+
+def test_place_oco_order_success(bot, fake_client):
+    """Test successful OCO order placement"""
+    # Mock successful response
+    fake_client.futures_create_oco_order.configure(result=_OCO_OK)
+    
+    result = bot.place_oco_order("BTCUSDT", "SELL", 0.001, 50000, 45000, 44900)
+    
+    # Verify the result
+    expected = {'status': 'SUCCESS', 'order_type': 'OCO', 'symbol': 'BTCUSDT', 'side': 'SELL',
+                'quantity': 0.001, 'limit_price': 50000, 'stop_price': 45000, 'stop_limit_price': 44900}
+    assert expected.items() <= result.items()
+    
+    # Verify the API call
+    assert fake_client.futures_create_oco_order.calls == [{
+        'symbol': 'BTCUSDT',
+        'side': 'SELL',
+        'quantity': 0.001,
+        'price': 50000,
+        'stopPrice': 45000,
+        'stopLimitPrice': 44900,
+        'stopLimitTimeInForce': 'GTC'
+    }]
+
+
+def test_sign(bot):
+    """Test request signing matches a freshly keyed HMAC-SHA256"""
+    query = b"symbol=BTCUSDT&side=BUY&type=MARKET&quantity=0.001"
+    expected = hmac.new(API_SECRET.encode(), query, hashlib.sha256).hexdigest()
+    
+    # Signing twice must not leak state between signatures
+    assert bot._sign(query) == expected
+    assert bot._sign(query) == expected
+
+
+def test_place_market_order_over_websocket(bot, fake_client):
+    """Test market order submission over the WebSocket API"""
+    bot._ws = Mock()
+    
+    with patch.object(BasicBot, '_ws_request', return_value=_MARKET_OK) as mock_ws_request:
+        result = bot.place_market_order("BTCUSDT", "BUY", 0.001)
+    
+    # Verify the order went over the WebSocket API, not REST
+    assert result['order_id'] == 123456789
+    mock_ws_request.assert_called_once_with('order.place', {
+        'symbol': 'BTCUSDT',
+        'side': 'BUY',
+        'type': 'MARKET',
+        'quantity': 0.001
+    })
+    assert fake_client.futures_create_order.calls == []
+
+
+@pytest.fixture(scope="module")
+def ws_server():
+    """
+    In-process WebSocket API server, yielding its URL and the requests it received
+    
+    Replies are chosen by symbol: ERRUSDT gets an error status, DROPUSDT has
+    its connection closed, ABORTUSDT has it dropped without a close frame,
+    SLOWUSDT is never answered, anything else fills.
+    """
+    received = []
+    
+    async def handler(websocket):
+        async for frame in websocket:
+            request = json.loads(frame)
+            received.append(request)
+            symbol = request['params']['symbol']
+            if symbol == 'DROPUSDT':
+                await websocket.close()
+                return
+            if symbol == 'ABORTUSDT':
+                websocket.transport.abort()
+                return
+            if symbol == 'SLOWUSDT':
+                continue
+            if symbol == 'ERRUSDT':
+                reply = {'id': request['id'], 'status': 400, 'error': {'code': -1013, 'msg': 'Invalid symbol.'}}
+            else:
+                reply = {'id': request['id'], 'status': 200, 'result': _MARKET_OK}
+            await websocket.send(json.dumps(reply))
+    
+    async def serve():
+        return await websockets.serve(handler, "127.0.0.1", 0)
+    
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    server = asyncio.run_coroutine_threadsafe(serve(), loop).result()
+    yield f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}", received
+    
+    server.close()
+    asyncio.run_coroutine_threadsafe(server.wait_closed(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+
+
+@pytest.fixture
+def ws_bot(ws_server):
+    """A BasicBot connected to the in-process WebSocket API server"""
+    url, received = ws_server
+    received.clear()
+    with patch('basic_bot.Client', FakeClient), patch('basic_bot.WS_API_URL', url):
+        bot = BasicBot(API_KEY, API_SECRET, use_ws=True)
+    yield bot
+    bot.close()
+
+
+def test_ws_order_success(ws_bot, ws_server):
+    """Test a signed order.place frame is sent and its response resolves the order"""
+    result = ws_bot.place_market_order("BTCUSDT", "BUY", 0.001)
+    
+    expected = {'status': 'SUCCESS', 'order_type': 'MARKET', 'symbol': 'BTCUSDT', 'side': 'BUY',
+                'quantity': 0.001, 'order_id': 123456789}
+    assert expected.items() <= result.items()
+    assert ws_bot.client.futures_create_order.calls == []
+    assert ws_bot._ws_pending == {}
+    
+    # Verify the frame: stringified params, API key, timestamp and a valid signature
+    (request,) = ws_server[1]
+    assert request['method'] == 'order.place'
+    params = dict(request['params'])
+    signature = params.pop('signature')
+    assert {'symbol': 'BTCUSDT', 'side': 'BUY', 'type': 'MARKET', 'quantity': '0.001',
+            'apiKey': API_KEY}.items() <= params.items()
+    query = urlencode(sorted(params.items())).encode()
+    assert signature == hmac.new(API_SECRET.encode(), query, hashlib.sha256).hexdigest()
+    
+    # close() shuts the connection and its event loop down
+    ws_bot.close()
+    assert ws_bot._ws is None and ws_bot._ws_loop is None
+
+
+def test_ws_order_error_status(ws_bot):
+    """Test a non-200 response is reported as an API error"""
+    result = ws_bot.place_market_order("ERRUSDT", "BUY", 0.001)
+    
+    assert result['status'] == 'ERROR'
+    assert result['error'] == 'APIError(code=-1013): Invalid symbol.'
+    assert ws_bot._ws_pending == {}
+
+
+def test_ws_connection_closed(ws_bot):
+    """Test a request pending when the server closes the connection fails instead of hanging"""
+    result = ws_bot.place_market_order("DROPUSDT", "BUY", 0.001)
+    
+    assert result == {'status': 'ERROR', 'error': 'WebSocket API connection closed',
+                      'timestamp_ns': result['timestamp_ns']}
+    assert ws_bot._ws_pending == {}
+
+
+def test_ws_connection_dropped(ws_bot):
+    """Test orders fall back to REST after the connection drops without a close frame"""
+    result = ws_bot.place_market_order("ABORTUSDT", "BUY", 0.001)
+    
+    assert result['status'] == 'ERROR'
+    assert ws_bot._ws is None
+    
+    # Later orders go over REST, and close() does not re-raise the dropped connection
+    ws_bot.client.futures_create_order.configure(result=_MARKET_OK)
+    result = ws_bot.place_market_order("BTCUSDT", "BUY", 0.001)
+    assert result['status'] == 'SUCCESS'
+    assert len(ws_bot.client.futures_create_order.calls) == 1
+    ws_bot.close()
+
+
+@patch('basic_bot.Client', FakeClient)
+def test_ws_connect_failure_stops_threads():
+    """Test a failed WebSocket connect stops the threads the constructor started"""
+    # Bind then release a port so nothing is listening on it
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        url = f"ws://127.0.0.1:{sock.getsockname()[1]}"
+    before = set(threading.enumerate())
+    
+    with patch('basic_bot.WS_API_URL', url), pytest.raises(OSError):
+        BasicBot(API_KEY, API_SECRET, use_ws=True)
+    
+    started = set(threading.enumerate()) - before
+    for thread in started:
+        thread.join(timeout=1)
+    assert not any(thread.is_alive() for thread in started)
+
+
+def test_ws_request_timeout(ws_bot):
+    """Test an unanswered request times out with a message and is no longer pending"""
+    with patch('basic_bot.WS_REQUEST_TIMEOUT', 0.2):
+        result = ws_bot.place_market_order("SLOWUSDT", "BUY", 0.001)
+    
+    assert result['status'] == 'ERROR'
+    assert result['error'] == 'No WebSocket API response to order.place within 0.2s'
+    # The cancelled request is dropped on the WebSocket loop thread
+    asyncio.run_coroutine_threadsafe(asyncio.sleep(0), ws_bot._ws_loop).result()
+    assert ws_bot._ws_pending == {}
+
+
+def test_place_orders_concurrently(bot, fake_client):
+    """Test placing several orders in one batch"""
+    fake_client.futures_create_order.configure(result=_LIMIT_OK)
+    orders = [
+        {'order_type': 'MARKET', 'symbol': 'BTCUSDT', 'side': 'BUY', 'quantity': 0.001},
+        {'order_type': 'LIMIT', 'symbol': 'ETHUSDT', 'side': 'SELL', 'quantity': 0.01, 'price': 3000},
+        {'order_type': 'TRAILING', 'symbol': 'BTCUSDT', 'side': 'BUY', 'quantity': 0.001}
+    ]
+    
+    results = asyncio.run(bot.place_orders(orders))
+    
+    # Verify one result per order, in order
+    assert len(results) == 3
+    assert results[0]['order_type'] == 'MARKET'
+    assert results[1]['order_type'] == 'LIMIT'
+    assert isinstance(results[2], ValueError)
+    assert len(fake_client.futures_create_order.calls) == 2
+
+
+def test_place_batch_orders(bot, fake_client):
+    """Test placing several orders in one batch request"""
+    fake_client.futures_place_batch_order.configure(result=[
+        _LIMIT_OK,
+        {'code': -2019, 'msg': 'Margin is insufficient.'}
+    ])
+    orders = [
+        {'order_type': 'LIMIT', 'symbol': 'BTCUSDT', 'side': 'BUY', 'quantity': 0.001, 'price': 40000},
+        {'order_type': 'STOP_MARKET', 'symbol': 'BTCUSDT', 'side': 'SELL', 'quantity': 0.001, 'stop_price': 39000}
+    ]
+    
+    result = bot.place_batch_orders(orders)
+    
+    # Verify each order is reported individually
+    assert result['status'] == 'SUCCESS'
+    assert result['orders'][0]['status'] == 'SUCCESS'
+    assert result['orders'][0]['order_id'] == 123456789
+    assert result['orders'][1]['status'] == 'ERROR'
+    
+    # Verify the API call
+    assert fake_client.futures_place_batch_order.calls == [{'batchOrders': [
+        {'symbol': 'BTCUSDT', 'side': 'BUY', 'type': 'LIMIT', 'timeInForce': 'GTC', 'quantity': '0.001', 'price': '40000'},
+        {'symbol': 'BTCUSDT', 'side': 'SELL', 'type': 'STOP_MARKET', 'quantity': '0.001', 'stopPrice': '39000'}
+    ]}]
+
+
+def test_place_batch_orders_too_many(bot, fake_client):
+    """Test batches over the exchange limit are rejected before any API call"""
+    orders = [{'order_type': 'MARKET', 'symbol': 'BTCUSDT', 'side': 'BUY', 'quantity': 0.001}] * 6
+    
+    result = bot.place_batch_orders(orders)
+    
+    assert result['status'] == 'ERROR'
+    assert fake_client.futures_place_batch_order.calls == []
+
+
+def test_unexpected_error_propagates(bot, fake_client):
+    """Test errors outside the expected API errors are not swallowed"""
+    fake_client.futures_create_order.configure(exc=RuntimeError("bug"))
+    
+    with pytest.raises(RuntimeError, match="bug"):
+        bot.place_market_order("BTCUSDT", "BUY", 0.001)
+
+
+def test_format_time_cached_per_second():
+    """Test records in the same second reuse one timestamp string"""
+    formatter = FastFormatter('%(asctime)s - %(message)s')
+    first = logging.makeLogRecord({'msg': 'first', 'created': 1700000000.1})
+    second = logging.makeLogRecord({'msg': 'second', 'created': 1700000000.9})
+    later = logging.makeLogRecord({'msg': 'later', 'created': 1700000001.0})
+    
+    assert formatter.formatTime(first) is formatter.formatTime(second)
+    assert formatter.formatTime(second) != formatter.formatTime(later)
+    assert formatter.format(later).endswith(' - later')
+
+
+
+
+def run_cli(*argv):
+    """Run basic_bot.main() in demo mode with argv, returning its stdout and whether the bot was closed"""
+    with patch.object(sys, 'argv', ['basic_bot.py', '--demo', *argv]), \
+            patch.object(BasicBot, 'close', autospec=True) as mock_close:
+        basic_bot.main()
+    return mock_close.called
+
+
+def test_cli_missing_oco_fields(capsys):
+    """Test the CLI lists every missing OCO field, treating a 0 price as given"""
+    closed = run_cli('--symbol', 'BTCUSDT', '--side', 'BUY', '--order-type', 'OCO',
+                     '--quantity', '0.001', '--limit-price', '0')
+    
+    assert capsys.readouterr().out == "Error: stop-price, stop-limit-price required for OCO orders\n"
+    assert closed
+
+
+def test_cli_prints_iso_timestamp(capsys):
+    """Test the CLI prints the result with timestamp_ns also rendered as an ISO timestamp"""
+    closed = run_cli('--symbol', 'BTCUSDT', '--side', 'BUY', '--order-type', 'MARKET', '--quantity', '0.001')
+    
+    result = json.loads(capsys.readouterr().out)
+    assert result['status'] == 'SUCCESS'
+    assert result['timestamp'] == datetime.fromtimestamp(result['timestamp_ns'] / 1e9).isoformat()
+    assert closed
+
+def make_gui(**attrs):
+    """A BasicBotGUI with no window: only the given attributes are set"""
+    gui = BasicBotGUI.__new__(BasicBotGUI)
+    gui.root = Mock()
+    gui._log_queue = deque()
+    gui._ui_calls = deque()
+    gui._ui_calls_pending = False
+    for name, value in attrs.items():
+        setattr(gui, name, value)
+    return gui
+
+
+def test_gui_posted_calls_run_immediately():
+    """Test worker callbacks are scheduled without the log flush delay and all run if one fails"""
+    gui = make_gui()
+    ran = []
+    
+    def fail():
+        raise RuntimeError("callback bug")
+    
+    gui._post_to_ui(fail)
+    gui._post_to_ui(ran.append, "second")
+    gui.root.after.assert_called_once_with(0, gui._run_ui_calls)
+    
+    gui._run_ui_calls()
+    assert ran == ["second"]
+    assert not gui._ui_calls and not gui._ui_calls_pending
+    exc_type, exc, _ = gui.root.report_callback_exception.call_args.args
+    assert exc_type is RuntimeError and str(exc) == "callback bug"
+
+
+def test_gui_flush_backoff_recovers():
+    """Test the flush delay backs off while flushes run late and returns once they are on time"""
+    gui = make_gui(_flush_pending=False, _flush_ms=16, _flush_late_ms=0.0, _flush_due_at=0.0)
+    now = [0.0]
+    
+    def flush(late_s):
+        gui._schedule_flush()
+        now[0] = gui._flush_due_at + late_s
+        gui._flush_ui()
+    
+    with patch('gui_bot.time.perf_counter', lambda: now[0]):
+        for _ in range(10):
+            flush(0.1)
+        assert gui._flush_ms == 33
+        for _ in range(50):
+            flush(0.0)
+    
+    assert gui._flush_ms == 16
+    assert gui._flush_late_ms < 1
+
+
+@pytest.mark.parametrize("raw,expected", [
+    ("BTCUSDT", "BTCUSDT"),
+    (" ethusdt ", "ETHUSDT"),
+    ("1000PEPEUSDT", "1000PEPEUSDT"),
+])
+def test_gui_parse_symbol_ok(raw, expected):
+    """Test GUI symbol entries are normalized, including digit-prefixed symbols"""
+    assert _parse_symbol(raw) == expected
+
+
+@pytest.mark.parametrize("raw", [
+    pytest.param("USDT", id="bare-quote"),
+    pytest.param("BTCUSD", id="wrong-quote"),
+    pytest.param("BTC-USDT", id="punctuation"),
+    pytest.param("", id="empty"),
+])
+def test_gui_parse_symbol_bad(raw):
+    """Test malformed GUI symbol entries are rejected"""
+    with pytest.raises(ValueError, match="followed by USDT"):
+        _parse_symbol(raw)
+
+
+@pytest.mark.parametrize("raw,match", [
+    pytest.param("abc", "Price must be a number", id="non-numeric"),
+    pytest.param("", "Price must be a number", id="empty"),
+    pytest.param("0", "Price must be greater than 0", id="zero"),
+    pytest.param("-5", "Price must be greater than 0", id="negative"),
+])
+def test_gui_positive_float_bad(raw, match):
+    """Test price entries must be numbers greater than 0"""
+    with pytest.raises(ValueError, match=match):
+        _positive_float("Price")(raw)
+
+
+def oco_gui(side, limit_price, stop_price):
+    """A windowless GUI whose parsed fields hold a valid OCO order"""
+    fields = {
+        'symbol': ('BTCUSDT', None),
+        'side': (side, None),
+        'quantity': (0.001, None),
+        'oco_limit_price': (limit_price, None),
+        'oco_stop_price': (stop_price, None),
+        'oco_stop_limit_price': (stop_price, None),
+    }
+    return make_gui(_fields=fields, order_type_var=Mock(get=Mock(return_value="OCO")))
+
+
+@pytest.mark.parametrize("side,limit_price,stop_price", [
+    ("BUY", 51000.0, 50000.0),
+    ("SELL", 49000.0, 50000.0),
+])
+def test_gui_build_oco_order_ok(side, limit_price, stop_price):
+    """Test OCO orders with the limit price on the right side of the stop price"""
+    assert oco_gui(side, limit_price, stop_price)._build_order() == {
+        'order_type': 'OCO', 'symbol': 'BTCUSDT', 'side': side, 'quantity': 0.001,
+        'limit_price': limit_price, 'stop_price': stop_price, 'stop_limit_price': stop_price
+    }
+
+
+@pytest.mark.parametrize("side,limit_price,relation", [
+    pytest.param("BUY", 49000.0, "higher", id="buy-below"),
+    pytest.param("BUY", 50000.0, "higher", id="buy-equal"),
+    pytest.param("SELL", 51000.0, "lower", id="sell-above"),
+    pytest.param("SELL", 50000.0, "lower", id="sell-equal"),
+])
+def test_gui_build_oco_order_bad(side, limit_price, relation):
+    """Test OCO orders with the limit price on the wrong side of, or equal to, the stop price"""
+    with pytest.raises(ValueError, match=f"For {side} orders: Limit price should be {relation}"):
+        oco_gui(side, limit_price, 50000.0)._build_order()
+
+
+def test_gui_build_order_reports_invalid_field():
+    """Test the first invalid required field is reported, and unused fields are ignored"""
+    gui = oco_gui("BUY", 51000.0, 50000.0)
+    gui._fields['price'] = (None, "Price must be a number")
+    gui.order_type_var.get.return_value = "MARKET"
+    assert gui._build_order()['order_type'] == "MARKET"
+    
+    gui._fields['quantity'] = (None, "Quantity must be greater than 0")
+    with pytest.raises(ValueError, match="Quantity must be greater than 0"):
+        gui._build_order()
 
 if __name__ == "__main__":
-    run_tests() 
\ No newline at end of file
+    # Report the 10 slowest tests; the cache plugin is not needed here
+    sys.exit(pytest.main([__file__, "-q", "--tb=short", "--durations=10", "-p", "no:cacheprovider"]))